@@ -0,0 +1,173 @@
+""" Batch rendering of large amounts of names across a pool of worker processes or threads.
+
+    Workers are seeded once with a serialized snapshot of the Nomenclate (its format and token state through
+    nomenclate.core.tools.Serializable.to_json plus the config it renders against) and then render whole chunks
+    of token dictionaries at a time with nomenclate.core.nomenclature.Nomenclate.get_many.
+
+    >>> import nomenclate
+    >>> import nomenclate.batch
+    >>> n = nomenclate.Nom(side='left', type='locator')
+    >>> names = list(nomenclate.batch.render_batch(n, ({'name': 'obj%d' % i} for i in range(100000))))
+"""
+import itertools
+from functools import partial
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
+from .core import configurator as config
+from .core.nomenclature import Nomenclate
+
+DEFAULT_CHUNK_SIZE = 1000
+
+_worker_nomenclate = None
+
+
+class BatchRenderer(object):
+    """ Renders token dictionaries against a Nomenclate in chunks across a pool of worker processes.
+        Results are always yielded in input order.
+    """
+
+    pool_type = Pool
+
+    def __init__(self, nomenclate_object, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, progress_callback=None):
+        """
+
+        :param nomenclate_object: nomenclate.core.nomenclature.Nomenclate, instance to render against
+        :param workers: int, number of workers in the pool, defaults to the cpu count
+        :param chunk_size: int, number of token dictionaries each worker renders per task
+        :param progress_callback: callable, called with the running total of rendered names after each chunk
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1, got %r" % chunk_size)
+        self.nomenclate_object = nomenclate_object
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.progress_callback = progress_callback
+
+    def render(self, token_dicts):
+        """ Renders all token dictionaries, the Nomenclate is snapshotted when the rendering starts.
+
+        :param token_dicts: Iterable(dict), token:value pairs to render, same as the kwargs for Nomenclate.get
+        :return: Generator(str), the rendered names in input order
+        """
+        rendered_count = 0
+        with self.create_pool() as pool:
+            for rendered_chunk in pool.imap(self.chunk_renderer, chunk(token_dicts, self.chunk_size)):
+                for rendered in rendered_chunk:
+                    yield rendered
+                rendered_count += len(rendered_chunk)
+                if self.progress_callback:
+                    self.progress_callback(rendered_count)
+
+    def create_pool(self):
+        return self.pool_type(
+            self.workers, initializer=initialize_worker, initargs=(get_seed(self.nomenclate_object),)
+        )
+
+    @property
+    def chunk_renderer(self):
+        return render_chunk
+
+
+class ThreadBatchRenderer(BatchRenderer):
+    """ Renders token dictionaries against a Nomenclate in chunks across a pool of threads.
+        The threads share the Nomenclate directly since rendering never modifies it.
+    """
+
+    pool_type = ThreadPool
+
+    def create_pool(self):
+        return self.pool_type(self.workers)
+
+    @property
+    def chunk_renderer(self):
+        return partial(render_chunk, nomenclate_object=self.nomenclate_object)
+
+
+def render_batch(
+    nomenclate_object,
+    token_dicts,
+    workers=None,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    progress_callback=None,
+    use_threads=False,
+):
+    """ Renders token dictionaries against a Nomenclate across a process (or thread) pool.
+
+    :param nomenclate_object: nomenclate.core.nomenclature.Nomenclate, instance to render against
+    :param token_dicts: Iterable(dict), token:value pairs to render, same as the kwargs for Nomenclate.get
+    :param workers: int, number of workers in the pool, defaults to the cpu count
+    :param chunk_size: int, number of token dictionaries each worker renders per task
+    :param progress_callback: callable, called with the running total of rendered names after each chunk
+    :param use_threads: bool, whether to use a thread pool instead of a process pool
+    :return: Generator(str), the rendered names in input order
+    """
+    renderer_type = ThreadBatchRenderer if use_threads else BatchRenderer
+    batch_renderer = renderer_type(
+        nomenclate_object, workers=workers, chunk_size=chunk_size, progress_callback=progress_callback
+    )
+    return batch_renderer.render(token_dicts)
+
+
+def chunk(iterable, chunk_size):
+    """ Splits an iterable into lists of chunk_size items, the last one holds the remainder.
+
+    :param iterable: Iterable, input to split
+    :param chunk_size: int, length of the chunks
+    :return: Generator(list), the chunks
+    """
+    iterator = iter(iterable)
+    while True:
+        items = list(itertools.islice(iterator, chunk_size))
+        if not items:
+            return
+        yield items
+
+
+def get_seed(nomenclate_object):
+    """ Serializes everything a worker needs to render like the given Nomenclate.
+
+    :param nomenclate_object: nomenclate.core.nomenclature.Nomenclate, instance to serialize
+    :return: dict, picklable seed for initialize_worker
+    """
+    nomenclate_class = type(nomenclate_object)
+    settings = {}
+    for token in nomenclate_object.token_dict.to_json():
+        settings.update(nomenclate_class.get_token_settings(token))
+
+    return {
+        "nomenclate": nomenclate_object.to_json(),
+        "config": list(nomenclate_object.CFG.config.items()),
+        "settings": settings,
+        "attributes": {
+            attr: value
+            for attr, value in vars(nomenclate_object).items()
+            # private attributes are derived state the worker's Nomenclate rebuilds itself
+            if attr not in nomenclate_object.SERIALIZE_ATTRS and not attr.startswith("_")
+        },
+    }
+
+
+def initialize_worker(seed):
+    """ Rebuilds the seeded Nomenclate in a worker process.  The worker gets its own config built from the seeded
+        config data so no config file is loaded (or created) in the worker.
+
+    :param seed: dict, seed as created by get_seed
+    """
+    global _worker_nomenclate
+    Nomenclate.CFG = config.ConfigParse(data=seed["config"])
+    Nomenclate.reset_from_config()
+    Nomenclate.initialize_overall_config_settings(input_dict=seed["settings"])
+
+    _worker_nomenclate = Nomenclate.from_json(seed["nomenclate"])
+    for attr, value in seed["attributes"].items():
+        setattr(_worker_nomenclate, attr, value)
+
+
+def render_chunk(token_dicts, nomenclate_object=None):
+    """ Renders a chunk of token dictionaries against the given or the worker's seeded Nomenclate.
+
+    :param token_dicts: list(dict), token:value pairs to render
+    :param nomenclate_object: nomenclate.core.nomenclature.Nomenclate, instance to render against
+    :return: list(str), the rendered names
+    """
+    return list((nomenclate_object or _worker_nomenclate).get_many(token_dicts))
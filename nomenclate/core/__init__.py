@@ -11,5 +11,5 @@ from . import tokens
 from . import tools
 from . import renderers
 from . import processing
-
-nomenclature.Nomenclate.reset_from_config()
+from . import patterns
+from . import table
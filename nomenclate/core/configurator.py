@@ -1,14 +1,25 @@
-import yaml
+import os
+import threading
+from copy import deepcopy
 from typing import List
 from collections import OrderedDict
-from .tools import gen_dict_key_matches
+from .tools import gen_dict_key_matches, flatten
 from ..settings import TEMPLATE_YML_CONFIG_FILE_PATH, DEFAULT_YML_CONFIG_FILE
 from .file_utils import (
     search_relative_cwd_user_dirs_for_file,
     validate_yaml_file,
     copy_file_to_home_dir,
+    get_file_signature,
+    load_yaml_file,
 )
-from .errors import ResourceNotFoundError
+from .errors import ResourceNotFoundError, SourceError
+
+# Shared configs keyed by resolved config file path and the resolved path for each requested config file name
+_shared_configs = {}
+_shared_config_paths = {}
+# Guards first time loading of shared configs and initialization of their owners across threads, re-entrant since
+# an owner's reset_from_config queries the shared config again
+_shared_config_lock = threading.RLock()
 
 
 class ConfigEntryFormatter(object):
@@ -94,6 +105,12 @@ class ConfigParse(object):
         """
         self.config = None
         self.config_filepath = None
+        self.config_signature = None
+        # Memo for renderers of options looked up from this config, emptied whenever the config data changes
+        self.option_cache = OrderedDict()
+        self.key_indexes = {}
+        # Memo of format strings by format target (format string or config path), emptied with the config data
+        self.format_cache = OrderedDict()
 
         if data:
             self.set_from_dict(data)
@@ -118,6 +135,10 @@ class ConfigParse(object):
         :param data: dict, the input data that will override the current config settings.
         """
         self.config = OrderedDict(sorted(data, key=lambda x: x[0], reverse=True))
+        self.config_signature = None
+        self.option_cache.clear()
+        self.key_indexes.clear()
+        self.format_cache.clear()
 
     @classmethod
     def validate_config_file(cls, config_filename: str):
@@ -130,15 +151,26 @@ class ConfigParse(object):
         :return: bool, success status
         """
         self.config_filepath = self.validate_config_file(config_filename)
-        config_data = None
-        with open(self.config_filepath, "r") as f:
-            config_data = yaml.safe_load(f)
+        # Taken before reading so a change made while the file is read is picked up by the next refresh
+        config_signature = get_file_signature(self.config_filepath)
+        config_data = deepcopy(load_yaml_file(self.config_filepath))
         try:
             items = config_data.items()
         except AttributeError:
             items = list(config_data)
         finally:
             self.set_from_dict(items)
+        self.config_signature = config_signature
+
+    def refresh(self):
+        """ Reloads the config file if it has changed on disk (modification time or size) since it was loaded.
+            Does nothing if the config was not loaded from a file or was since set from a dictionary.
+        """
+        if self.config_signature is None:
+            return
+        signature = get_file_signature(self.config_filepath)
+        if signature is not None and signature != self.config_signature:
+            self.set_from_file(self.config_filepath)
 
     def get(self, query_path=None, return_type=list, preceding_depth: int = None):
         """ Traverses the list of query paths to find the data requested
@@ -165,6 +197,48 @@ class ConfigParse(object):
         except IndexError:
             return return_type()
 
+    def get_key_index(self, query_path):
+        """ Gets a flattened index of every key at any depth of the config entry at query_path to the flattened
+            values found for it, the same values tools.gen_dict_key_matches then tools.flatten would find.
+            Each key is also indexed in lower case (unless that clashes with an existing key) for case insensitive
+            lookups.  The index is built once per query path each time the config is loaded.
+
+        :param query_path: (list(str), str), query path to the config entry to index
+        :return: (dict, None), key: list(values) index or None if the config entry is not a dictionary
+        :raises: exceptions.ResourceNotFoundError: if the query path is invalid
+        """
+        index_key = tuple(query_path) if isinstance(query_path, list) else query_path
+        try:
+            return self.key_indexes[index_key]
+        except KeyError:
+            config_entry = self.get(query_path, return_type=dict)
+            key_index = None
+            if isinstance(config_entry, dict):
+                key_index = OrderedDict()
+                self._index_keys(config_entry, key_index, ())
+                for key, values in key_index.items():
+                    key_index[key] = list(flatten(values))
+                for key, values in list(key_index.items()):
+                    if isinstance(key, str):
+                        key_index.setdefault(key.lower(), values)
+            self.key_indexes[index_key] = key_index
+            return key_index
+
+    @classmethod
+    def _index_keys(cls, dictionary, key_index, parent_keys):
+        """ Recursively adds every key's value to the index.  A key nested under a key of the same name is skipped
+            since a search for that key stops at the outer one.
+
+        :param dictionary: dict, dictionary to index
+        :param key_index: dict, index being built of key: list(values)
+        :param parent_keys: tuple(str), keys on the path to this dictionary
+        """
+        for key, value in dictionary.items():
+            if key not in parent_keys:
+                key_index.setdefault(key, []).append(value)
+            if isinstance(value, dict):
+                cls._index_keys(value, key_index, parent_keys + (key,))
+
     def _get_path_entry_from_string(self, query_string, first_found=True, full_path=False):
         """ Parses a string to form a list of strings that represents a possible config entry header
 
@@ -206,6 +280,93 @@ class ConfigParse(object):
         return return_type()
 
 
+def get_shared_config(config_filename: str = DEFAULT_YML_CONFIG_FILE, refresh=True) -> ConfigParse:
+    """ Gets the process wide ConfigParse for the given config file, loading it on first request.
+        Config file names resolving to the same file share one ConfigParse.
+        If the default config file can not be found the template config is copied to the home directory.
+
+    :param config_filename: str, the config file to load
+    :param refresh: bool, whether to reload an already loaded config if its file changed on disk
+    :return: ConfigParse, the shared config
+    """
+    try:
+        config_parse = _shared_configs[_shared_config_paths[config_filename]]
+    except KeyError:
+        with _shared_config_lock:
+            try:
+                return _shared_configs[_shared_config_paths[config_filename]]
+            except KeyError:
+                return _load_shared_config(config_filename)
+
+    if refresh:
+        config_parse.refresh()
+    return config_parse
+
+
+def _load_shared_config(config_filename: str) -> ConfigParse:
+    try:
+        config_filepath = ConfigParse.validate_config_file(config_filename)
+    except SourceError:
+        if config_filename != DEFAULT_YML_CONFIG_FILE:
+            raise
+        config_filepath = copy_file_to_home_dir(TEMPLATE_YML_CONFIG_FILE_PATH, DEFAULT_YML_CONFIG_FILE)
+
+    config_filepath = os.path.realpath(config_filepath)
+    config_parse = _shared_configs.get(config_filepath)
+    if config_parse is None:
+        config_parse = _shared_configs[config_filepath] = ConfigParse(config_filename=config_filepath)
+    _shared_config_paths[config_filename] = config_filepath
+    return config_parse
+
+
+class SharedConfig(object):
+    """ Class attribute descriptor that hands out the shared config for a config file.  Nothing is loaded until
+        the attribute is first accessed, at which point the owner class' reset_from_config (if any) is run once
+        so any settings derived from the config are initialized as well.
+        Setting the attribute on an instance overrides it for that instance only.
+    """
+
+    def __init__(self, config_filename: str = DEFAULT_YML_CONFIG_FILE):
+        self.config_filename = config_filename
+        self.owner = None
+        self.initialized = False
+        self.initializing = False
+
+    def __set_name__(self, owner, name):
+        self.owner = owner
+
+    def __get__(self, instance, owner):
+        config_parse = get_shared_config(self.config_filename, refresh=False)
+        if not self.initialized:
+            with _shared_config_lock:
+                # The initializing thread gets the config as is if reset_from_config queries it again
+                if not self.initialized and not self.initializing:
+                    self.initializing = True
+                    try:
+                        reset_from_config = getattr(self.owner, "reset_from_config", None)
+                        if reset_from_config:
+                            reset_from_config()
+                        self.initialized = True
+                    finally:
+                        self.initializing = False
+        return config_parse
+
+
+class SharedConfigEntry(object):
+    """ Class attribute descriptor that queries the shared config on access so it is never loaded up front.
+    """
+
+    def __init__(self, query_path, return_type=list, config_filename: str = DEFAULT_YML_CONFIG_FILE):
+        self.query_path = query_path
+        self.return_type = return_type
+        self.config_filename = config_filename
+
+    def __get__(self, instance, owner):
+        return get_shared_config(self.config_filename, refresh=False).get(
+            self.query_path, return_type=self.return_type
+        )
+
+
 class FormatterRegistry(type):
     """ Factory class responsible for registering all input type to type conversions.
     E.G. - String -> List, Dict -> String etc.
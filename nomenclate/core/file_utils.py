@@ -5,6 +5,8 @@ from typing import List, Callable
 from pathlib import Path
 from .errors import SourceError
 
+_yaml_file_cache = {}
+
 
 def find_file(search_paths: List[str], validator: Callable = None) -> str:
     """ Validates the filepath to the config.  
@@ -62,9 +64,45 @@ def validate_yaml_file(file_path: str) -> None:
         if os.path.getsize(file_path) == 0:
             raise IOError("File %s is empty" % file_path)
 
+    if load_yaml_file(file_path) is None:
+        raise IOError("No YAML config was found in file %s" % file_path)
+
+
+def get_file_signature(file_path: str):
+    """ Gets a signature of the file's current state on disk to detect changes to it.
+
+    :param file_path: str, file path to query
+    :return: (tuple(float, int), None), the modification time and size of the file or None if it can't be accessed
+    """
+    try:
+        return os.path.getmtime(file_path), os.path.getsize(file_path)
+    except OSError:
+        return None
+
+
+def load_yaml_file(file_path: str):
+    """ Loads a YAML file, each file is only parsed once per process until its modification time or size changes.
+        The result is shared between callers so it should be treated as read only.
+
+    :param file_path: str, file path to the YAML file to load
+    :return: object, the loaded YAML data
+    :raises: IOError
+    """
+    cache_key = os.path.realpath(file_path)
+    signature = get_file_signature(file_path)
+    try:
+        cached_signature, data = _yaml_file_cache[cache_key]
+        if signature is not None and signature == cached_signature:
+            return data
+    except KeyError:
+        pass
+
     with open(file_path, "r") as f:
-        if yaml.safe_load(f) is None:
-            raise IOError("No YAML config was found in file %s" % file_path)
+        data = yaml.safe_load(f)
+
+    if signature is not None:
+        _yaml_file_cache[cache_key] = (signature, data)
+    return data
 
 
 def copy_file_to_home_dir(file_path: str, copy_filename: str):
@@ -1,11 +1,19 @@
 #!/usr/bin/env python
-import re
+from collections import namedtuple
+from functools import lru_cache
 from . import errors as exceptions
+from . import patterns
 import nomenclate.settings as settings
+from .tools import Serializable
 
+FORMAT_CACHE_SIZE = 256
 
+ParsedFormat = namedtuple("ParsedFormat", ["format_string", "format_order"])
 
-class FormatString(object):
+
+class FormatString(Serializable):
+
+    SERIALIZE_ATTRS = ["format_string"]
 
     @property
     def format_order(self):
@@ -14,14 +22,13 @@ class FormatString(object):
     @format_order.setter
     def format_order(self, format_target):
         if format_target:
-            self.processed_format_order = self.get_valid_format_order(format_target)
+            self.processed_format_order = list(self.get_parsed_format(format_target).format_order)
         else:
             self.processed_format_order = []
 
     def __init__(self, format_string=""):
         self.processed_format_order = []
         self.format_string = format_string
-        self.format_order = self.format_string
         self.swap_format(format_string)
 
     def swap_format(self, format_target):
@@ -31,6 +38,32 @@ class FormatString(object):
         except exceptions.FormatError as e:
             raise e
 
+    def copy_format(self, format_string_object):
+        """ Swaps to the format of another FormatString without reparsing or revalidating it.
+
+        :param format_string_object: FormatString, already validated format to swap to
+        """
+        self.processed_format_order = list(format_string_object.format_order)
+        self.format_string = format_string_object.format_string
+
+    @classmethod
+    def get_parsed_format(cls, format_target):
+        """ Gets the validated parse of a format string.  Parses are interned in a process wide LRU cache so every
+            FormatString of the same format shares one immutable parse result.
+
+        :param format_target: str, format string to parse
+        :return: ParsedFormat, the format string and its tuple of tokens
+        :raises: nomenclate.core.errors.FormatError
+        """
+        if not isinstance(format_target, str):
+            return ParsedFormat(format_target, tuple(cls.get_valid_format_order(format_target)))
+        return cls._get_parsed_format(format_target)
+
+    @classmethod
+    @lru_cache(maxsize=FORMAT_CACHE_SIZE)
+    def _get_parsed_format(cls, format_target):
+        return ParsedFormat(format_target, tuple(cls.get_valid_format_order(format_target)))
+
     @classmethod
     def parse_format_order(cls, format_target):
         """ Dissects the format string and gets the order of the tokens as it finds them l->r
@@ -42,8 +75,7 @@ class FormatString(object):
         :return: list(str), list of the matching tokens
         """
         try:
-            pattern = re.compile(settings.FORMAT_STRING_REGEX)
-            return [match.group() for match in pattern.finditer(format_target)]# if None not in match.groups()]
+            return [match.group() for match in patterns.FORMAT_STRING.finditer(format_target)]# if None not in match.groups()]
         except TypeError:
             raise exceptions.FormatError('Format string %s is not a valid input type, must be <type str>' %
                                          format_target)
@@ -63,12 +95,12 @@ class FormatString(object):
     @staticmethod
     def remove_tokens(format_target, format_order):
         for format_str in format_order:
-            format_target = re.sub(format_str, '', format_target, count=1)
+            format_target = patterns.compile_pattern(format_str).sub('', format_target, count=1)
         return format_target
 
     @staticmethod
     def remove_static_text(format_target):
-        return re.sub(settings.REGEX_STATIC_TOKEN, '', format_target)
+        return patterns.STATIC_TOKEN.sub('', format_target)
 
     @classmethod
     def validate_separator_characters(cls, separator_characters):
@@ -110,5 +142,10 @@ class FormatString(object):
             if not balanced(format_target):
                 raise exceptions.BalanceError("Format string has unmatching parentheses.")
 
+    def merge_json(self, json_blob):
+        if json_blob.get("format_string") is not None:
+            self.swap_format(json_blob["format_string"])
+        return True
+
     def __str__(self):
         return str(self.format_string)
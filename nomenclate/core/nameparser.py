@@ -7,7 +7,82 @@
 import re
 import datetime
 import itertools
+from functools import lru_cache
 from . import configurator as config
+from . import patterns
+
+STRPTIME_CACHE_SIZE = 1024
+
+
+class AbbreviationMatcher(object):
+    """ A one time compiled matcher over the casing permutations of a list of options' abbreviations.
+        All abbreviations are folded into a single case insensitive trie regex so one pass over a name
+        finds every abbreviation present, and only those abbreviations' search regexes are tried.
+
+    """
+
+    def __init__(self, options):
+        """
+
+        :param options: list(tuple(str, list(tuple(str, list(list(str)))))), each option paired with its
+                        lowercase abbreviations and the search regexes for each of their casing permutations
+        """
+        self.options = options
+        self.abbreviations = set(
+            abbreviation for _, option_abbreviations in options for abbreviation, _ in option_abbreviations
+        )
+        self.regex = re.compile(
+            "(?=(%s))" % self._build_trie_regex(self.abbreviations), flags=re.IGNORECASE
+        )
+
+    def find_abbreviations(self, name):
+        """ Finds every abbreviation that occurs anywhere in the name, ignoring case, in a single pass.
+            The trie regex returns the longest abbreviation at each position and every shorter abbreviation
+            starting at the same position must be one of its prefixes.
+
+        :param name: str, name to be searched
+        :return: set(str), lowercase abbreviations found in the name
+        """
+        found = set()
+        if not self.abbreviations:
+            return found
+        for longest in self.regex.findall(name):
+            longest = longest.lower()
+            found.update(longest[:index] for index in range(1, len(longest) + 1))
+        return found & self.abbreviations
+
+    @classmethod
+    def _build_trie_regex(cls, words):
+        """ Builds a regex from a trie of the words so that no two alternatives share a leading character
+            e.g. = ['l', 'le', 'left'] -> l(?:e(?:ft)?)?
+
+        :param words: iterable(str), words to be matched
+        :return: str, output regex
+        """
+        trie = {}
+        for word in words:
+            node = trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        return cls._build_trie_node_regex(trie)
+
+    @classmethod
+    def _build_trie_node_regex(cls, node):
+        """ Recursively builds the regex for a single trie node, the empty key marks the end of a word
+
+        :param node: dict, trie node
+        :return: str, output regex
+        """
+        branches = [
+            re.escape(char) + cls._build_trie_node_regex(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not branches:
+            return ""
+        result = branches[0] if len(branches) == 1 else "(?:%s)" % "|".join(branches)
+        return "(?:%s)?" % result if "" in node else result
 
 
 class NameParser(object):
@@ -15,8 +90,8 @@ class NameParser(object):
 
     """
 
-    CONFIG_SIDES = config.ConfigParse().get(["options", "side"])
-    CONFIG_DISCIPLINES = config.ConfigParse().get(["options", "discipline"])
+    CONFIG_SIDES = config.SharedConfigEntry(["options", "side"])
+    CONFIG_DISCIPLINES = config.SharedConfigEntry(["options", "discipline"])
     PARSABLE = ["basename", "version", "date", "side", "udim"]
 
     REGEX_BASENAME = r"(?:^[-._]+)?([a-zA-Z0-9_\-|]+?)(?=[-._]{2,}|\.)"
@@ -33,48 +108,136 @@ class NameParser(object):
     REGEX_DATE = r"(?<!\d)(%s)(?!\d)"
     REGEX_CAMEL = r"(?:{SEP}?)((?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z]))(?:{SEP}?)"
 
+    DATE_FORMATS = [
+        "%Y-%m-%d_%H-%M-%S",
+        "%Y-%m-%d-%H-%M-%S",
+        "%Y-%m-%d--%H-%M-%S",
+        "%y_%m_%dT%H_%M_%S",
+        "%Y-%m-%d%H-%M-%S",
+        "%Y%m%d-%H%M%S",
+        "%Y%m%d-%H%M",
+        "%Y-%m-%d",
+        "%Y%m%d",
+        "%m_%d_%Y",
+        "%m_%d_%y",
+        "%m%d%y",
+        "%m%d%Y",
+        "%d_%m_%Y",
+        "%Y",
+        "%m-%d-%yy",
+        "%m%d%Y",
+    ]
+    DATE_FORMAT_MAPPING = [
+        ("%yy", r"(([01]\d{1}))"),
+        ("%Y", r"((19|20)\d{2})"),
+        ("%y", r"(\d{2})"),
+        ("%d", r"(\d{2})"),
+        ("%m", r"(\d{2})"),
+        ("%H", r"(\d{2})"),
+        ("%M", r"(\d{2})"),
+        ("%S", r"(\d{2})"),
+    ]
+
+    _side_matchers = {}
+    _discipline_patterns = {}
+    _date_patterns = []
+    _date_regex = None
+
     @classmethod
-    def parse_name(cls, name):
+    def parse_name(cls, name, side_matcher=None):
         """ Parses a name into a dictionary of identified subsections with accompanying information to
             correctly identify and replace if necessary
 
         :param name: str, string to be parsed
+        :param side_matcher: AbbreviationMatcher, precomputed side matcher from get_side_matcher
         :return: dict, dictionary with relevant parsed information
         """
         parse_dict = dict.fromkeys(cls.PARSABLE, None)
         parse_dict["date"] = cls.get_date(name)
-        parse_dict["version"] = cls.get_version(name)
+        parse_dict["version"] = cls.get_version_naive(
+            name, ignore=cls._get_date_string(parse_dict["date"])
+        )
         parse_dict["udim"] = cls.get_udim(name)
-        parse_dict["side"] = cls.get_side(name)
+        parse_dict["side"] = cls.get_side(name, side_matcher=side_matcher)
         parse_dict["basename"] = cls.get_base_naive(cls._reduce_name(name, parse_dict))
         return parse_dict
 
     @classmethod
-    def get_side(cls, name, ignore=""):
+    def parse_names(cls, names):
+        """ Parses many names, yielding the parse dictionary of each name as soon as it is parsed.
+            The side matcher is resolved from the config once for the whole run instead of once per name.
+
+        :param names: iterable(str), names to be parsed
+        :return: generator(dict), parse dictionaries in the same order as the input names
+        """
+        side_matcher = cls.get_side_matcher()
+        for name in names:
+            yield cls.parse_name(name, side_matcher=side_matcher)
+
+    @classmethod
+    def get_side(cls, name, ignore="", side_matcher=None):
         """ Checks a string for a possible side string token, this assumes its on its own
             and is not part of or camel cased and combined with a word.  Returns first found side to reduce duplicates.
             We can be safe to assume the abbreviation for the side does not have camel casing within its own word.
 
         :param name: str, string that represents a possible name of an object
-        :param name: str, string that represents a possible name of an object
+        :param ignore: str, specific ignore string for the search to avoid
+        :param side_matcher: AbbreviationMatcher, precomputed side matcher from get_side_matcher
         :return: (None, str), either the found permutation of the side found in name or None
         """
-        for side in cls.CONFIG_SIDES:
-            """ Tried using a regex, however it would've taken too long to debug
-            side_regex = cls._build_abbreviation_regex(side)
-            result = cls._generic_search(name, side_regex, metadata={'side': side}, ignore=ignore)
-            if result:
-                return result
-            """
-            for permutations in cls.get_string_camel_patterns(side):
-                for permutation in permutations:
-                    result = cls._generic_search(
-                        name, permutation, metadata={"side": side}, ignore=ignore
+        side_matcher = side_matcher or cls.get_side_matcher()
+        found = side_matcher.find_abbreviations(name)
+        if not found:
+            return None
+
+        # Sides, abbreviations and permutations are still tried in their original priority order,
+        # abbreviations that do not occur in the name could never produce a match so are skipped
+        for side, abbreviations in side_matcher.options:
+            metadata = {"side": side}
+            for abbreviation, permutation_patterns in abbreviations:
+                if abbreviation not in found:
+                    continue
+                for search_patterns in permutation_patterns:
+                    result = cls._search_patterns(
+                        name, search_patterns, metadata=metadata, ignore=ignore
                     )
                     if result:
                         return result
         return None
 
+    @classmethod
+    def get_side_matcher(cls, sides=None):
+        """ Gets the abbreviation matcher for every valid casing permutation of every side's abbreviations.
+            It is only built once per unique list of sides.
+
+        :param sides: list(str), sides to build the matcher for, defaults to the configured sides
+        :return: AbbreviationMatcher, the side matcher
+        """
+        sides = tuple(cls.CONFIG_SIDES if sides is None else sides)
+        try:
+            return cls._side_matchers[sides]
+        except KeyError:
+            side_matcher = AbbreviationMatcher(
+                [
+                    (
+                        side,
+                        [
+                            (
+                                permutations[0].lower(),
+                                [
+                                    cls._get_generic_search_patterns(permutation)
+                                    for permutation in permutations
+                                ],
+                            )
+                            for permutations in cls.get_string_camel_patterns(side)
+                        ],
+                    )
+                    for side in sides
+                ]
+            )
+            cls._side_matchers[sides] = side_matcher
+            return side_matcher
+
     @classmethod
     def get_discipline(cls, name, ignore="", min_length=3):
         """ Checks a string for a possible discipline string token, this assumes its on its own
@@ -86,21 +249,40 @@ class NameParser(object):
         :param min_length: int, minimum length for possible abbreviations of disciplines. Lower = more wrong guesses.
         :return: dict, match dictionary
         """
-        for discipline in cls.CONFIG_DISCIPLINES:
-            re_abbr = "({RECURSE}(?=[0-9]|[A-Z]|{SEPARATORS}))".format(
-                RECURSE=cls._build_abbreviation_regex(discipline), SEPARATORS=cls.REGEX_SEPARATORS
-            )
+        for re_abbr in cls.get_discipline_patterns():
             matches = cls._get_regex_search(name, re_abbr, ignore=ignore)
             if matches:
                 matches = [
                     m
                     for m in matches
-                    if re.findall("([a-z]{%d,})" % min_length, m["match"], flags=re.IGNORECASE)
+                    if patterns.compile_pattern(
+                        "([a-z]{%d,})" % min_length, flags=re.IGNORECASE
+                    ).findall(m["match"])
                 ]
                 if matches:
                     return matches[-1]
         return None
 
+    @classmethod
+    def get_discipline_patterns(cls, disciplines=None):
+        """ Gets the abbreviation search regex for every discipline, only built once per unique list of disciplines.
+
+        :param disciplines: list(str), disciplines to build the patterns for, defaults to the configured disciplines
+        :return: list(str), abbreviation search regexes in discipline order
+        """
+        disciplines = tuple(cls.CONFIG_DISCIPLINES if disciplines is None else disciplines)
+        try:
+            return cls._discipline_patterns[disciplines]
+        except KeyError:
+            discipline_patterns = [
+                "({RECURSE}(?=[0-9]|[A-Z]|{SEPARATORS}))".format(
+                    RECURSE=cls._build_abbreviation_regex(discipline), SEPARATORS=cls.REGEX_SEPARATORS
+                )
+                for discipline in disciplines
+            ]
+            cls._discipline_patterns[disciplines] = discipline_patterns
+            return discipline_patterns
+
     @classmethod
     def get_base(cls, name):
         """ Checks a string for a possible base name of an object (no prefix, no suffix).
@@ -131,12 +313,7 @@ class NameParser(object):
         """
         # Dates can confuse th
         # is stuff, so we'll check for that first and remove it from the string if found
-        try:
-            date = cls.get_date(name)
-            date = date["datetime"].strftime(date["format"])
-        except TypeError:
-            pass
-        return cls.get_version_naive(name, ignore=date or "")
+        return cls.get_version_naive(name, ignore=cls._get_date_string(cls.get_date(name)))
 
     @classmethod
     def get_version_naive(cls, name, ignore=""):
@@ -207,59 +384,98 @@ class NameParser(object):
         :param name: str, string that represents a possible name of an object
         :return: datetime.datetime, datetime object with current time or None if not found
         """
-        time_formats = [
-            "%Y-%m-%d_%H-%M-%S",
-            "%Y-%m-%d-%H-%M-%S",
-            "%Y-%m-%d--%H-%M-%S",
-            "%y_%m_%dT%H_%M_%S",
-            "%Y-%m-%d%H-%M-%S",
-            "%Y%m%d-%H%M%S",
-            "%Y%m%d-%H%M",
-            "%Y-%m-%d",
-            "%Y%m%d",
-            "%m_%d_%Y",
-            "%m_%d_%y",
-            "%m%d%y",
-            "%m%d%Y",
-            "%d_%m_%Y",
-            "%Y",
-            "%m-%d-%yy",
-            "%m%d%Y",
-        ]
+        # One pass collects the first match of every date format, formats are then tried in priority order
+        first_matches = {}
+        for obj in cls.get_date_regex().finditer(name):
+            for group_name, group in obj.groupdict().items():
+                if group is not None and group_name not in first_matches:
+                    first_matches[group_name] = (obj.span(group_name), group)
+
+        for index, (date_regex, time_format) in enumerate(cls.get_date_patterns()):
+            try:
+                span, date_string = first_matches["date%d" % index]
+            except KeyError:
+                continue
+            date_time = cls._strptime(date_string, time_format.replace("%yy", "%y"))
+            if date_time is not None:
+                return {
+                    "pattern": date_regex,
+                    "input": name,
+                    "position": span,
+                    "position_full": span,
+                    "match": date_string,
+                    "match_full": date_string,
+                    "format": time_format,
+                    "datetime": date_time,
+                }
+        return None
 
-        mapping = [
-            ("%yy", "(([01]\d{1}))"),
-            ("%Y", "((19|20)\d{2})"),
-            ("%y", "(\d{2})"),
-            ("%d", "(\d{2})"),
-            ("%m", "(\d{2})"),
-            ("%H", "(\d{2})"),
-            ("%M", "(\d{2})"),
-            ("%S", "(\d{2})"),
-        ]
-        time_regexes = []
-        for time_format in time_formats:
-            for k, v in mapping:
-                time_format = time_format.replace(k, v)
-            time_regexes.append(time_format)
-
-        for time_regex, time_format in zip(time_regexes, time_formats):
-            match = cls._get_regex_search(
-                name, cls.REGEX_DATE % time_regex, metadata={"format": time_format}, match_index=0
+    @classmethod
+    def get_date_patterns(cls):
+        """ Gets the date search regex for every entry in DATE_FORMATS, only built once.
+
+        :return: list(tuple(str, str)), date search regex paired with its time format in priority order
+        """
+        if not cls._date_patterns:
+            for time_format in cls.DATE_FORMATS:
+                cls._date_patterns.append(
+                    (cls.REGEX_DATE % cls._get_time_regex(time_format), time_format)
+                )
+        return cls._date_patterns
+
+    @classmethod
+    def get_date_regex(cls):
+        """ Gets a single compiled regex that finds every date format in one pass, only built once.
+            It stops at the start of each run of digits and tries every format there as a lookahead
+            so each format's match is captured in a group named date<index of format in DATE_FORMATS>.
+
+        :return: re.Pattern, compiled date regex
+        """
+        if cls._date_regex is None:
+            cls._date_regex = re.compile(
+                r"(?<!\d)(?=\d)"
+                + "".join(
+                    r"(?:(?=(?P<date%d>%s)(?!\d))|)" % (index, cls._get_time_regex(time_format))
+                    for index, time_format in enumerate(cls.DATE_FORMATS)
+                )
             )
-            if match:
-                try:
-                    match.update(
-                        {
-                            "datetime": datetime.datetime.strptime(
-                                match["match"], time_format.replace("%yy", "%y")
-                            )
-                        }
-                    )
-                    return match
-                except ValueError:
-                    pass
-        return None
+        return cls._date_regex
+
+    @classmethod
+    def _get_time_regex(cls, time_format):
+        """ Replaces the directives in a time format with their regexes from DATE_FORMAT_MAPPING
+
+        :param time_format: str, strftime style time format
+        :return: str, output regex
+        """
+        for k, v in cls.DATE_FORMAT_MAPPING:
+            time_format = time_format.replace(k, v)
+        return time_format
+
+    @staticmethod
+    def _get_date_string(date_match):
+        """ Formats a get_date match back into its date string so it can be ignored by other searches
+
+        :param date_match: (dict, None), match dictionary from get_date
+        :return: str, the formatted date or an empty string if there was no date
+        """
+        if date_match is None:
+            return ""
+        return date_match["datetime"].strftime(date_match["format"])
+
+    @staticmethod
+    @lru_cache(maxsize=STRPTIME_CACHE_SIZE)
+    def _strptime(date_string, time_format):
+        """ Cached datetime.strptime since the same date strings are repeated across many names
+
+        :param date_string: str, date string to be parsed
+        :param time_format: str, strptime format
+        :return: (datetime.datetime, None), parsed datetime or None if the date is not viable
+        """
+        try:
+            return datetime.datetime.strptime(date_string, time_format)
+        except ValueError:
+            return None
 
     @classmethod
     def get_string_camel_patterns(cls, name, min_length=0):
@@ -345,7 +561,7 @@ class NameParser(object):
         :param metadata: dict, dictionary of extra meta tags needed to identify information
         :return: list(dict), list of dictionaries if multiple hits or a specific entry or None
         """
-        generator = re.compile(regex, flags=flags).finditer(input_string)
+        generator = patterns.compile_pattern(regex, flags=flags).finditer(input_string)
         matches = []
         for obj in generator:
             try:
@@ -389,15 +605,40 @@ class NameParser(object):
         :param ignore: str, ignore specific string for the search
         :return: dict, dictionary of search results
         """
-        patterns = [cls.REGEX_ABBR_SEOS, cls.REGEX_ABBR_ISLAND, cls.REGEX_ABBR_CAMEL]
+        return cls._search_patterns(
+            name, cls._get_generic_search_patterns(search_string), metadata=metadata, ignore=ignore
+        )
+
+    @classmethod
+    def _get_generic_search_patterns(cls, search_string):
+        """ Formats the three abbreviation search regexes for a string, skipping the camel case one if not capitalized
+
+        :param search_string: str, string to insert into the search regexes
+        :return: list(str), formatted search regexes in search order
+        """
+        templates = [cls.REGEX_ABBR_SEOS, cls.REGEX_ABBR_ISLAND, cls.REGEX_ABBR_CAMEL]
 
         if not search_string[0].isupper():
-            patterns.remove(cls.REGEX_ABBR_CAMEL)
+            templates.remove(cls.REGEX_ABBR_CAMEL)
+
+        return [
+            template.format(ABBR=search_string, SEP=cls.REGEX_SEPARATORS) for template in templates
+        ]
+
+    @classmethod
+    def _search_patterns(cls, name, search_patterns, metadata={}, ignore=""):
+        """ Returns the first valid camel cased match from a list of already formatted search regexes
 
-        for pattern in patterns:
+        :param name: str, name of object in question
+        :param search_patterns: list(str), formatted search regexes from _get_generic_search_patterns
+        :param metadata: dict, metadata to add to the result if we find a match
+        :param ignore: str, ignore specific string for the search
+        :return: dict, dictionary of search results
+        """
+        for search_pattern in search_patterns:
             search_result = cls._get_regex_search(
                 name,
-                pattern.format(ABBR=search_string, SEP=cls.REGEX_SEPARATORS),
+                search_pattern,
                 metadata=metadata,
                 match_index=0,
                 ignore=ignore,
@@ -1,13 +1,15 @@
 #!/usr/bin/env python
 
-from nomenclate.settings import DEFAULT_YML_CONFIG_FILE
 from . import configurator as config
 from . import errors
 from . import tokens
 from . import formatter
 from . import rendering
+from functools import lru_cache
 from .tools import combine_dicts, Serializable
 
+KEY_TYPE_CACHE_SIZE = 1024
+
 
 class Nomenclate(Serializable):
     """This class deals with renaming of objects in an approved pattern
@@ -25,7 +27,13 @@ class Nomenclate(Serializable):
     SIDE_PATH = OPTIONS_PATH + ["side"]
 
     CONFIG_OPTIONS = dict()
-    CFG = config.ConfigParse(config_filename=DEFAULT_YML_CONFIG_FILE)
+    CFG = config.SharedConfig()
+    FORMAT_TARGET_CACHE_SIZE = 256
+
+    # Lower case tokens of the current format, kept in sync on format swaps for constant time token get/set
+    _format_tokens = frozenset()
+
+    TOKEN_KEY, CONFIG_KEY, UNKNOWN_KEY = "token", "config", "unknown"
 
     def __init__(self, input_dict: dict = None, format_string: str = "", *args, **kwargs):
         """
@@ -80,16 +88,40 @@ class Nomenclate(Serializable):
         :return: None
         """
         original_format, original_format_order = (self.format, self.format_order)
+        self.format_string_object.swap_format(self.get_format_string(format_target))
+        self._update_tokens_from_swap_format(
+            original_format, original_format_order, remove_obsolete=remove_obsolete
+        )
+
+    def get_format_string(self, format_target):
+        """ Gets the format string for a format target, which is the entry in the config if it is one or else the
+            format target itself.  Targets are memoized per config in an LRU of FORMAT_TARGET_CACHE_SIZE entries so
+            swapping between formats only queries the config once per format.
 
+        :param format_target: (str, list(str)), format string or query path to a format in the config
+        :return: str, the format string
+        """
+        format_key = tuple(format_target) if isinstance(format_target, list) else format_target
+        format_cache = self.CFG.format_cache
         try:
-            format_target = self.CFG.get(format_target, return_type=str)
-        except (errors.ResourceNotFoundError, KeyError):
+            format_string = format_cache[format_key]
+            format_cache.move_to_end(format_key)
+            return format_string
+        except (KeyError, TypeError):
             pass
 
-        self.format_string_object.swap_format(format_target)
-        self._update_tokens_from_swap_format(
-            original_format, original_format_order, remove_obsolete=remove_obsolete
-        )
+        try:
+            format_string = self.CFG.get(format_target, return_type=str)
+        except (errors.ResourceNotFoundError, KeyError):
+            format_string = format_target
+
+        try:
+            format_cache[format_key] = format_string
+        except TypeError:
+            return format_string
+        while len(format_cache) > self.FORMAT_TARGET_CACHE_SIZE:
+            format_cache.popitem(last=False)
+        return format_string
 
     @classmethod
     def set_config(cls, config_data: dict):
@@ -100,6 +132,7 @@ class Nomenclate(Serializable):
 
     @classmethod
     def reset_from_config(cls):
+        cls.CFG.refresh()
         cls.initialize_overall_config_settings()
         cls.initialize_options()
 
@@ -127,6 +160,7 @@ class Nomenclate(Serializable):
             self.format_string_object.swap_format(
                 self.CFG.get(self.DEFAULT_FORMAT_PATH, return_type=str)
             )
+            self._format_tokens = frozenset(token.lower() for token in self.format_order)
 
     @classmethod
     def initialize_options(cls):
@@ -136,14 +170,56 @@ class Nomenclate(Serializable):
         cls.CONFIG_OPTIONS = cls.CFG.get(cls.CONFIG_ROOT, return_type=dict)
 
     def get(self, **kwargs):
-        """Gets the string of the current name of the object
+        """Gets the string of the current name of the object.  Any kwargs only apply to this render, the
+        Nomenclate itself is never modified.
         Returns (string): the name of the object
         """
-        old_state = self.state.copy()
-        self.merge_dict(kwargs)
-        result = rendering.InputRenderer.render_nomenclative(self)
-        self.merge_dict(old_state)
-        return result
+        input_dict = self._convert_input(**kwargs)
+        configs = self._sift_configs(input_dict)
+        token_values = tokens.TokenAttrList.merge_token_values(self.state, input_dict)
+        return rendering.render(self.format, token_values, self, settings=configs)
+
+    def get_many(self, token_dicts):
+        """ Renders each input dictionary against the current format and state without modifying this Nomenclate.
+            The format parse, config token settings and renderer resolution are shared across the whole batch.
+            Unlike get, any config settings in an input dictionary (e.g. version_padding) only apply to that render.
+
+        :param token_dicts: Iterable(dict), token:value pairs to render, same as the kwargs for get
+        :return: Generator(str), the rendered names in input order
+        """
+        render_plan = rendering.InputRenderer.get_render_plan(self.format)
+        token_values = self.state
+        token_settings = {}
+
+        for token_dict in token_dicts:
+            input_dict = self._convert_input(token_dict)
+            configs = self._sift_configs(input_dict)
+            render_values = tokens.TokenAttrList.merge_token_values(token_values, input_dict)
+            render_context = rendering.RenderContext(
+                self, render_values, settings=configs, token_settings=token_settings
+            )
+            yield render_plan.render(render_context, render_values)
+
+    def clone(self, *args, **kwargs):
+        """ Copies this Nomenclate's format, token state and instance settings in O(tokens) without reparsing the
+            format or resolving anything against the config, then merges any inputs into the copy like merge_dict.
+            Creating a prototype Nomenclate once and cloning it is much cheaper than constructing every instance.
+
+        :param args: (dict, Nomenclate), any number of dictionary inputs or Nomenclates to be converted to dicts
+        :param kwargs: str, any number of kwargs that represent token:value pairs
+        :return: Nomenclate, the new instance
+        """
+        format_string_object = formatter.FormatString()
+        format_string_object.copy_format(self.format_string_object)
+
+        nomenclate_object = self.__class__.__new__(self.__class__)
+        nomenclate_object.__dict__.update(self.__dict__)
+        nomenclate_object.__dict__.update(
+            format_string_object=format_string_object, token_dict=self.token_dict.copy()
+        )
+        if args or kwargs:
+            nomenclate_object.merge_dict(*args, **kwargs)
+        return nomenclate_object
 
     def merge_dict(self, *args, **kwargs):
         """ Takes variable inputs, compiles them into a dictionary then merges it to the current nomenclate's state
@@ -165,6 +241,8 @@ class Nomenclate(Serializable):
         :return: (dict, object, None), token setting dictionary or default
         """
         setting_dict = {}
+        # Make sure the config settings have been loaded onto the class
+        cls.CFG
 
         for key, value in cls.__dict__.items():
             if (
@@ -187,31 +265,25 @@ class Nomenclate(Serializable):
         :param remove_obsolete: bool, whether to remove obsolete tokens
                                              if off: persistent state across format swaps of missing tokens
         """
-        old_format_order = [_.lower() for _ in original_format_order]
-        new_format_order = [_.lower() for _ in self.format_order]
-        if hasattr(self, "token_dict") and self.format != original_format:
-            old_tokens = [
-                token
-                for token in list(set(old_format_order) - set(new_format_order))
-                if hasattr(self, token)
-            ]
-
+        old_format_tokens = set(token.lower() for token in original_format_order)
+        new_format_order = [token.lower() for token in self.format_order]
+        self._format_tokens = new_format_tokens = frozenset(new_format_order)
+        if "token_dict" in self.__dict__ and self.format != original_format:
             new_tokens = [
                 token
-                for token in set(new_format_order) - set(old_format_order)
-                if not hasattr(self, token) or isinstance(getattr(self, token, ""), str)
+                for token in new_format_order
+                if token not in old_format_tokens
+                and (not hasattr(self, token) or isinstance(getattr(self, token, ""), str))
             ]
 
-            self.merge_dict(dict.fromkeys(new_tokens, ""))
+            if new_tokens:
+                self.token_dict.merge_json(dict.fromkeys(new_tokens, ""))
 
             if remove_obsolete:
-                self.token_dict.purge_tokens(old_tokens)
+                self.token_dict.purge_tokens(old_format_tokens - new_format_tokens)
 
                 for new_token in new_tokens:
-                    try:
-                        delattr(self, new_token)
-                    except AttributeError:
-                        pass
+                    self.__dict__.pop(new_token, None)
 
     def _convert_input(self, *args, **kwargs):
         """ Takes variable inputs
@@ -228,23 +300,44 @@ class Nomenclate(Serializable):
         """ Removes all key/v for keys that exist in the overall config and activates them.
             Used to weed out config keys from tokens in a given input.
         """
-        configs = {}
-        for k, v in input_dict.items():
-            if k not in map(str.lower, self.format_order) and any(
-                [f_order.lower() in k for f_order in self.format_order]
-            ):
-                try:
-                    self.CFG.get(self.CONFIG_ROOT + [k])
-                except errors.ResourceNotFoundError:
-                    pass
-                finally:
-                    configs[k] = v
-
-        for key in configs.keys():
-            input_dict.pop(key, None)
+        configs = self._sift_configs(input_dict)
         if configs:
             self.initialize_overall_config_settings(input_dict=configs)
 
+    def _sift_configs(self, input_dict):
+        """ Removes all key/v for keys that exist in the overall config from the input and returns them.
+
+        :param input_dict: dict, input dictionary to sift, modified in place
+        :return: dict, the config key/v pairs
+        """
+        format_tokens = self._format_tokens
+        configs = {
+            k: v
+            for k, v in input_dict.items()
+            if self.get_key_type(k, format_tokens) == self.CONFIG_KEY
+        }
+
+        for key in configs:
+            del input_dict[key]
+        return configs
+
+    @classmethod
+    @lru_cache(maxsize=KEY_TYPE_CACHE_SIZE)
+    def get_key_type(cls, key, format_tokens):
+        """ Classifies an input key for a format: one of the format's tokens, a config setting for one of them
+            (any key containing a token, e.g. version_padding) or unknown (which gets added as a new token).
+            Classifications are kept in an LRU cache per format and key.
+
+        :param key: str, input key to classify
+        :param format_tokens: frozenset(str), lower case tokens of the format
+        :return: str, one of TOKEN_KEY, CONFIG_KEY or UNKNOWN_KEY
+        """
+        if key in format_tokens:
+            return cls.TOKEN_KEY
+        if any(token in key for token in format_tokens):
+            return cls.CONFIG_KEY
+        return cls.UNKNOWN_KEY
+
     def __eq__(self, other):
         return self.token_dict == other.token_dict
 
@@ -255,15 +348,20 @@ class Nomenclate(Serializable):
         """ Custom setattr to detect whether they are trying to set a token, then updating the token_dict
 
         """
-        if hasattr(self, "token_dict") and key in [s.lower() for s in self.format_order]:
-            if getattr(self.token_dict, key):
-                getattr(self.token_dict, key).set(value)
-            else:
+        if key in self._format_tokens and "token_dict" in self.__dict__:
+            try:
+                self.token_dict[key].set(value)
+            except IndexError:
                 self.token_dict.merge_serialization({key: value})
         else:
             object.__setattr__(self, key, value)
 
     def __getattr__(self, item):
+        if item in self._format_tokens:
+            try:
+                return object.__getattribute__(self, "token_dict")[item]
+            except (AttributeError, IndexError):
+                pass
         try:
             value = getattr(object.__getattribute__(self, "token_dict"), item)
         except AttributeError as error:
@@ -303,10 +401,17 @@ class Nomenclate(Serializable):
         return dir_augment(self)
 
     def to_json(self):
-        return {getattr(self, attr).to_json() for attr in self.SERIALIZE_ATTRS}
+        return {attr: getattr(self, attr).to_json() for attr in self.SERIALIZE_ATTRS}
 
+    @classmethod
     def from_json(cls, json_blob):
-        raise NotImplementedError
+        instance = cls()
+        instance.merge_json(json_blob)
+        return instance
 
     def merge_json(self, json_blob):
-        raise NotImplementedError
+        format_blob = json_blob.get("format_string_object")
+        if format_blob:
+            self.format = format_blob["format_string"]
+        self.token_dict.merge_json(json_blob.get("token_dict", {}))
+        return True
@@ -0,0 +1,62 @@
+""" Registry of the compiled regular expressions nomenclate uses.
+    The static patterns from nomenclate.settings are compiled once at import while dynamically built patterns
+    (per token searches, NameParser abbreviation patterns etc.) are compiled through bounded LRU caches.
+    Python's own re cache only holds 512 patterns and is shared with everything else in the process, so large
+    option lists easily evict each other from it.
+"""
+import re
+from functools import lru_cache
+import nomenclate.settings as settings
+
+PATTERN_CACHE_SIZE = 4096
+
+FORMAT_STRING = re.compile(settings.FORMAT_STRING_REGEX)
+STATIC_TOKEN = re.compile(settings.REGEX_STATIC_TOKEN)
+PARENTHESIS = re.compile(settings.REGEX_PARENTHESIS)
+SINGLE_PARENTHESIS = re.compile(settings.REGEX_SINGLE_PARENTHESIS)
+ADJACENT_UNDERSCORE = re.compile(settings.REGEX_ADJACENT_UNDERSCORE)
+MULTIPLE_SEPARATORS = re.compile("[%s]{2,}" % settings.SEPARATORS)
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def compile_pattern(pattern, flags=0):
+    """ Compiles a regex pattern, returning the cached compiled pattern for previously seen patterns.
+
+    :param pattern: str, regex pattern to compile
+    :param flags: int, re module flags to compile with
+    :return: re.Pattern, the compiled pattern
+    """
+    return re.compile(pattern, flags)
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def token_search_pattern(token):
+    """ Gets the compiled settings.REGEX_TOKEN_SEARCH pattern that finds the given token in a format string.
+
+    :param token: str, token to search for
+    :return: re.Pattern, the compiled pattern
+    """
+    regex_token = token.replace("(", "\\(").replace(")", "\\)")
+    return re.compile(
+        settings.REGEX_TOKEN_SEARCH.format(
+            TOKEN=regex_token, TOKEN_CAPITALIZED=regex_token.capitalize()
+        )
+    )
+
+
+def get_cache_stats():
+    """ Gets the hit/miss statistics of the dynamic pattern caches.
+
+    :return: dict, functools cache info (hits, misses, maxsize, currsize) per cache
+    """
+    return {
+        "compile_pattern": compile_pattern.cache_info(),
+        "token_search_pattern": token_search_pattern.cache_info(),
+    }
+
+
+def clear_caches():
+    """ Clears the dynamic pattern caches along with their statistics.
+    """
+    compile_pattern.cache_clear()
+    token_search_pattern.cache_clear()
@@ -1,4 +1,5 @@
 #!/usr/bin/env python
+import bisect
 from . import errors as exceptions
 import nomenclate.settings as settings
 
@@ -77,22 +78,39 @@ class TokenMatch(object):
 
 
 class Nomenclative(object):
+    """ Substitutes TokenMatches into a format string.  Matches are kept in a start sorted index alongside the
+        insertion ordered token_matches so overlap checks and the final substitution never rescan every match.
+    """
 
     def __init__(self, input_str):
         self.raw_formatted_string = input_str
         self.token_matches = []
+        self._sorted_matches = []
+        self._sorted_starts = []
 
     def process_matches(self):
-        build_str = self.raw_formatted_string
-        for token_match in self.token_matches:
+        """ Builds the substituted string in a single left to right pass over the start sorted matches.
+            Static token matches and any match that does not match the raw string at its position are left as is.
+
+        :return: str, the substituted string
+        """
+        build_str = []
+        position = 0
+        for token_match in self.validate_matches():
             # Do not process static token matches
             if token_match.match.startswith('(') or token_match.match.endswith(')'):
                 continue
 
-            if token_match.match == build_str[token_match.start:token_match.end]:
-                build_str = build_str[:token_match.start] + token_match.sub + build_str[token_match.end:]
-                self.adjust_other_matches(token_match)
-        return build_str
+            # Identical spans can coexist, only the first added is substituted
+            if token_match.start < position:
+                continue
+
+            if token_match.match == self.raw_formatted_string[token_match.start:token_match.end]:
+                build_str.append(self.raw_formatted_string[position:token_match.start])
+                build_str.append(token_match.sub)
+                position = token_match.end
+        build_str.append(self.raw_formatted_string[position:])
+        return ''.join(build_str)
 
     def adjust_other_matches(self, adjuster_match):
         for token_match in [token_match for token_match in self.token_matches if token_match != adjuster_match]:
@@ -108,17 +126,50 @@ class Nomenclative(object):
         try:
             self.validate_match(token_match)
             self.token_matches.append(token_match)
+            index = bisect.bisect_right(self._sorted_starts, token_match.start)
+            self._sorted_starts.insert(index, token_match.start)
+            self._sorted_matches.insert(index, token_match)
         except (IndexError, exceptions.OverlapError):
             raise exceptions.OverlapError('Not adding match %s as it conflicts with a preexisting match' % token_match)
 
     def validate_match(self, token_match_candidate):
-        for token_match in self.token_matches:
+        """ Checks a candidate against the existing matches.  Since the existing matches never overlap only the
+            matches either side of the candidate's start position can overlap it.
+
+        :param token_match_candidate: TokenMatch, match to check
+        :raises: nomenclate.core.errors.OverlapError
+        """
+        sorted_matches = self.get_sorted_matches()
+        index = bisect.bisect_right(self._sorted_starts, token_match_candidate.start)
+        for token_match in sorted_matches[max(index - 1, 0):index + 1]:
             try:
                 token_match.overlaps(token_match_candidate)
             except exceptions.OverlapError:
                 raise exceptions.OverlapError(
                     "Cannot add match %s due to overlap with %s" % (token_match, token_match_candidate))
 
+    def validate_matches(self):
+        """ Checks all matches for overlaps in a single sweep over the start sorted matches.
+
+        :return: list(TokenMatch), the start sorted matches
+        :raises: nomenclate.core.errors.OverlapError
+        """
+        sorted_matches = self.get_sorted_matches()
+        for previous_match, token_match in zip(sorted_matches, sorted_matches[1:]):
+            previous_match.overlaps(token_match)
+        return sorted_matches
+
+    def get_sorted_matches(self):
+        """ Gets the matches sorted by start position, matches with the same start stay in the order they were added.
+            The index is rebuilt if token_matches has been changed directly.
+
+        :return: list(TokenMatch), the start sorted matches
+        """
+        if len(self._sorted_matches) != len(self.token_matches):
+            self._sorted_matches = sorted(self.token_matches, key=lambda token_match: token_match.start)
+            self._sorted_starts = [token_match.start for token_match in self._sorted_matches]
+        return self._sorted_matches
+
     def __str__(self):
         matches = ' ' if not self.token_matches else ' '.join(map(str, self.token_matches))
         return 'format: %s: %s' % (self.raw_formatted_string, matches)
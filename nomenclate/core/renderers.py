@@ -1,14 +1,19 @@
 #!/usr/bin/env python
 import builtins
 import datetime
-import dateutil.parser as p
+import re
+import string
+from functools import lru_cache
 from . import rendering
 from . import errors as exceptions
 from .tools import gen_dict_key_matches, flatten
 
+DATE_CACHE_SIZE = 1024
+
 
 class RenderBase(metaclass=rendering.InputRenderer):
     token = "default"
+    OPTION_CACHE_SIZE = 4096
 
     @classmethod
     def render(
@@ -34,12 +39,83 @@ class RenderBase(metaclass=rendering.InputRenderer):
             if use_value_in_query_path:
                 config_query_path += [value]
 
+        option_cache = nomenclate_object.CFG.option_cache
+        option_key = (
+            cls,
+            token,
+            value,
+            tuple(config_query_path),
+            return_type,
+            tuple(sorted(kwargs.items())),
+        )
+        try:
+            option = option_cache[option_key]
+            option_cache.move_to_end(option_key)
+        except KeyError:
+            option = option_cache[option_key] = cls.get_option(
+                value, token, nomenclate_object, config_query_path, return_type, **kwargs
+            )
+            # Least recently used first, so one off values (e.g. names) never push out the hot options
+            while len(option_cache) > cls.OPTION_CACHE_SIZE:
+                option_cache.popitem(last=False)
+        except TypeError:
+            # Unhashable config settings, skip the memo
+            option = cls.get_option(
+                value, token, nomenclate_object, config_query_path, return_type, **kwargs
+            )
+        return cls.process_token_augmentations(option, token_attr=getattr(nomenclate_object, token))
+
+    @classmethod
+    def get_option(cls, value, token, nomenclate_object, config_query_path, return_type, **kwargs):
+        """ Finds the config option that matches the value, or the value itself if there is no match.
+            The result is memoized per config by render so this only runs once per value and settings.
+
+        :param value: str, value we are trying to match
+        :param token: str, token we are searching for
+        :param nomenclate_object: nomenclate.core.nomenclate.Nomenclate, instance of nomenclate object to query
+        :param config_query_path: list(str), the query path to the config entry to find the options in
+        :param return_type: type, the type of return value we want from the config
+        :param kwargs: any config settings that relate to the token as found from the nomenclate instance
+        :return: str, the matching option
+        """
         config_matches = cls.get_config_match(
             value, config_query_path, return_type, nomenclate_object, **kwargs
         )
         options = cls.flatten_input(config_matches, value)
-        option = cls.process_criteria(token, options, **kwargs) if options else value
-        return cls.process_token_augmentations(option, token_attr=getattr(nomenclate_object, token))
+        return cls.process_criteria(token, options, **kwargs) if options else value
+
+    @classmethod
+    def render_column(cls, values, token, nomenclate_object, **kwargs):
+        """ Renders a whole column of values for a token at once, rendering each distinct value only once.
+            Subclasses can override this to also do any work that is the same for every value just once.
+
+        :param values: list(str), values we are rendering
+        :param token: str, token we are rendering for
+        :param nomenclate_object: nomenclate.core.nomenclate.Nomenclate, instance of nomenclate object to query
+        :param kwargs: any config settings that relate to the token as found from the nomenclate instance
+        :return: list(str), the rendered strings in input order
+        """
+        return cls._render_unique(
+            values, lambda value: cls.render(value, token, nomenclate_object, **kwargs)
+        )
+
+    @staticmethod
+    def _render_unique(values, render_function):
+        """ Maps a render function over values, only calling it once per distinct value
+
+        :param values: list(str), values to be rendered
+        :param render_function: function, renders a single value
+        :return: list(str), the rendered strings in input order
+        """
+        rendered = {}
+        column = []
+        for value in values:
+            try:
+                column.append(rendered[value])
+            except KeyError:
+                label = rendered[value] = str(render_function(value))
+                column.append(label)
+        return column
 
     @classmethod
     def process_token_augmentations(cls, value, token_attr):
@@ -127,6 +203,11 @@ class RenderBase(metaclass=rendering.InputRenderer):
 
 class RenderDate(RenderBase):
     token = "date"
+    ISO_DATE_REGEX = re.compile(
+        r"(\d{4})-(\d{2})-(\d{2})(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.(\d{1,6}))?)?)?$"
+    )
+    # dateutil fills missing fields from its default, a date parsing the same with both is fully specified
+    SPECIFIED_DATE_DEFAULTS = (datetime.datetime(2000, 1, 1), datetime.datetime(2001, 2, 2))
 
     @classmethod
     def render(
@@ -139,15 +220,99 @@ class RenderDate(RenderBase):
         use_value_in_query_path=True,
         **kwargs
     ):
+        date_format = getattr(nomenclate_object, "%s_format" % cls.token, "%Y-%m-%d")
         if date == "now":
-            d = datetime.datetime.now()
-        else:
+            return cls.get_now(nomenclate_object).strftime(date_format)
+        return cls._render_date(date, date_format)
+
+    @classmethod
+    def render_column(cls, dates, token, nomenclate_object, **kwargs):
+        # All "now" dates in a column are rendered with the same timestamp
+        date_format = getattr(nomenclate_object, "%s_format" % cls.token, "%Y-%m-%d")
+        now = cls.get_now(nomenclate_object).strftime(date_format)
+        return cls._render_unique(
+            dates, lambda date: now if date == "now" else cls._render_date(date, date_format)
+        )
+
+    @classmethod
+    def get_now(cls, nomenclate_object):
+        """ Gets the datetime that "now" renders as.  Setting <token>_now (e.g. date_now) to a datetime freezes
+            "now" so a whole batch of renders uses one consistent timestamp, otherwise it is the current time.
+
+        :param nomenclate_object: nomenclate.core.nomenclature.Nomenclate, instance to query for the setting
+        :return: datetime.datetime, the frozen or current time
+        """
+        now = getattr(nomenclate_object, "%s_now" % cls.token, None)
+        return datetime.datetime.now() if now is None else now
+
+    @classmethod
+    def parse_date(cls, date, default=None):
+        """ Parses a date string.  ISO formatted dates (YYYY-MM-DD with an optional time) are built directly,
+            anything else is left to dateutil.
+
+        :param date: str, date string to parse
+        :param default: datetime.datetime, where dateutil takes any fields missing from the date, defaults to today
+        :return: datetime.datetime, the parsed date
+        :raises: ValueError
+        """
+        iso_match = cls.ISO_DATE_REGEX.match(date) if isinstance(date, str) else None
+        if iso_match:
+            year, month, day, hour, minute, second, microsecond = iso_match.groups()
             try:
-                d = p.parse(date)
+                return datetime.datetime(
+                    int(year),
+                    int(month),
+                    int(day),
+                    int(hour or 0),
+                    int(minute or 0),
+                    int(second or 0),
+                    int((microsecond or "0").ljust(6, "0")),
+                )
             except ValueError:
-                return ""
-        date_format = getattr(nomenclate_object, "%s_format" % cls.token, "%Y-%m-%d")
-        return d.strftime(date_format)
+                pass
+
+        # dateutil is slow to import and only needed when rendering dates
+        import dateutil.parser as p
+
+        return p.parse(date, default=default)
+
+    @classmethod
+    def _render_date(cls, date, date_format):
+        """ Parse and strftime of a date.  Fully specified dates are cached since the same dates are rendered over
+            and over, partial dates (e.g. "March 16") are not since dateutil completes them from today.
+
+        :param date: str, date string to render
+        :param date_format: str, strftime format
+        :return: str, the formatted date or an empty string if the date could not be parsed
+        """
+        rendered_date = cls._render_specified_date(date, date_format)
+        if rendered_date is not None:
+            return rendered_date
+
+        try:
+            return cls.parse_date(date).strftime(date_format)
+        except ValueError:
+            return ""
+
+    @classmethod
+    @lru_cache(maxsize=DATE_CACHE_SIZE)
+    def _render_specified_date(cls, date, date_format):
+        """ Cached parse and strftime of a date that does not depend on when it is parsed.
+
+        :param date: str, date string to render
+        :param date_format: str, strftime format
+        :return: (str, None), the formatted date or None if the date is partial or could not be parsed
+        """
+        try:
+            parsed_dates = [
+                cls.parse_date(date, default=default) for default in cls.SPECIFIED_DATE_DEFAULTS
+            ]
+        except ValueError:
+            return None
+
+        if parsed_dates[0] != parsed_dates[1]:
+            return None
+        return parsed_dates[0].strftime(date_format)
 
 
 class RenderVar(RenderBase):
@@ -169,6 +334,18 @@ class RenderVar(RenderBase):
             var = cls._get_variation_id(var, var_format.isupper())
         return cls.process_token_augmentations(var, token_attr=getattr(nomenclate_object, token))
 
+    @classmethod
+    def render_column(cls, variations, token, nomenclate_object, **kwargs):
+        capital = kwargs.get("%s_format" % cls.token, "A").isupper()
+        token_attr = getattr(nomenclate_object, token)
+
+        def render_var(var):
+            if isinstance(var, int):
+                var = cls._get_variation_id(var, capital)
+            return cls.process_token_augmentations(var, token_attr=token_attr)
+
+        return cls._render_unique(variations, render_var)
+
     @staticmethod
     def _get_variation_id(value, capital=False):
         """ Convert an integer value to a character. a-z then double aa-zz etc
@@ -186,15 +363,61 @@ class RenderVar(RenderBase):
             base_end += pow(26, base_power)
         base_index = value - base_start
 
-        # create alpha representation
+        # create alpha representation, integer division keeps very large indices exact
         alphas = ["a"] * base_power
         for index in range(base_power - 1, -1, -1):
-            alphas[index] = chr(int(97 + (base_index % 26)))
-            base_index /= 26
+            base_index, remainder = divmod(base_index, 26)
+            alphas[index] = chr(97 + remainder)
 
         characters = "".join(alphas)
         return characters.upper() if capital else characters
 
+    @classmethod
+    def get_variation_ids(cls, start, stop, capital=False):
+        """ Generate the variation ids for a range of integer values.  Only the start is converted from scratch,
+            every following id is the previous one incremented by one letter with a carry like an odometer.
+        Args:
+            start (int): first integer index of the range
+            stop (int): integer index the range stops before
+            capital (bool): whether we convert to capitals or not
+        Returns (generator): alphanumeric representation of each index in the range
+        """
+        start, stop = int(start), int(stop)
+        for _ in range(start, min(stop, 0)):
+            yield ""
+        start = max(start, 0)
+        if start >= stop:
+            return
+
+        alphabet = string.ascii_uppercase if capital else string.ascii_lowercase
+        digits = [ord(character) - 97 for character in cls._get_variation_id(start)]
+        for _ in range(start, stop):
+            yield "".join([alphabet[digit] for digit in digits])
+
+            index = len(digits) - 1
+            while index >= 0 and digits[index] == 25:
+                digits[index] = 0
+                index -= 1
+            if index >= 0:
+                digits[index] += 1
+            else:
+                digits.insert(0, 0)
+
+    @staticmethod
+    def get_variation_index(variation_id):
+        """ Convert a variation id back to the integer value it was rendered from, the inverse of _get_variation_id.
+        Args:
+            variation_id (str): alphabetic variation id, upper or lower case
+        Returns (int): integer index of the variation id
+        """
+        if not variation_id or variation_id.lower().strip(string.ascii_lowercase):
+            raise exceptions.ValidationError("Invalid variation id %r, expected letters a-z" % variation_id)
+
+        value = 0
+        for character in variation_id.lower():
+            value = value * 26 + ord(character) - 96
+        return value - 1
+
 
 class RenderLod(RenderVar):
     token = "lod"
@@ -202,6 +425,9 @@ class RenderLod(RenderVar):
 
 class RenderVersion(RenderBase):
     token = "version"
+    PADDING_FORMATS = {}
+    # str case methods that leave a string of digits (and a minus sign) untouched
+    NUMERIC_SAFE_CASES = {"", "upper", "lower", "title", "capitalize", "swapcase", "casefold"}
 
     @classmethod
     def render(
@@ -215,12 +441,64 @@ class RenderVersion(RenderBase):
         **kwargs
     ):
         padding = kwargs.get("%s_padding" % token, 4)
-        version_string = "%0{0}d"
-        version = version_string.format(padding) % int(version)
+        version = cls.get_padding_format(padding) % int(version)
         return cls.process_token_augmentations(
             version, token_attr=getattr(nomenclate_object, token)
         )
 
+    @classmethod
+    def render_column(cls, versions, token, nomenclate_object, **kwargs):
+        version_string = cls.get_padding_format(kwargs.get("%s_padding" % token, 4))
+        token_attr = getattr(nomenclate_object, token)
+        return cls._render_unique(
+            versions,
+            lambda version: cls.process_token_augmentations(
+                version_string % int(version), token_attr=token_attr
+            ),
+        )
+
+    @classmethod
+    def render_range(cls, start, stop, token, nomenclate_object, padding=None, **kwargs):
+        """ Renders every version in a range.  The token's prefix and suffix are baked into a single format string
+            with the padding so each version is rendered with one string formatting operation.
+
+        :param start: int, first version of the range
+        :param stop: int, version the range stops before
+        :param token: str, the given token to render
+        :param nomenclate_object: nomenclate.core.nomenclature.Nomenclate, instance to take the TokenAttr from
+        :param padding: int, zero padding for the versions, defaults to the <token>_padding setting or 4
+        :param kwargs: any config settings that relate to the token as found from the nomenclate instance
+        :return: generator(str), the rendered versions
+        """
+        if padding is None:
+            padding = kwargs.get("%s_padding" % token, 4)
+        token_attr = getattr(nomenclate_object, token)
+        version_string = cls.get_padding_format(padding)
+
+        if token_attr.case not in cls.NUMERIC_SAFE_CASES:
+            for version in range(int(start), int(stop)):
+                yield cls.process_token_augmentations(version_string % version, token_attr=token_attr)
+            return
+
+        augmented_string = "{}{}{}".format(
+            token_attr.prefix.replace("%", "%%"), version_string, token_attr.suffix.replace("%", "%%")
+        )
+        for version in range(int(start), int(stop)):
+            yield augmented_string % version
+
+    @classmethod
+    def get_padding_format(cls, padding):
+        """ Gets the (cached) printf style format string that zero pads a version to the given padding.
+
+        :param padding: int, zero padding for the versions
+        :return: str, format string
+        """
+        try:
+            return cls.PADDING_FORMATS[padding]
+        except KeyError:
+            version_string = cls.PADDING_FORMATS[padding] = "%0{0}d".format(padding)
+            return version_string
+
 
 class RenderType(RenderBase):
     token = "type"
@@ -245,3 +523,50 @@ class RenderType(RenderBase):
             **kwargs
         )
 
+    @classmethod
+    def render_column(cls, engine_types, token, nomenclate_object, **kwargs):
+        token_attr = getattr(nomenclate_object, cls.token)
+
+        def render_type(engine_type):
+            option = cls.get_option(
+                engine_type,
+                cls.token,
+                nomenclate_object,
+                nomenclate_object.SUFFIXES_PATH,
+                dict,
+                **kwargs
+            )
+            return cls.process_token_augmentations(option, token_attr=token_attr)
+
+        return cls._render_unique(engine_types, render_type)
+
+    @classmethod
+    def get_option(
+        cls, engine_type, token, nomenclate_object, config_query_path, return_type, **kwargs
+    ):
+        """ Looks the type up in the config's flattened suffix index instead of searching the whole suffix config.
+            Types with no exact match are matched case insensitively.  Falls back on the default config search
+            if the suffixes are missing or not a dictionary.
+
+        :param engine_type: str, the node type we are finding the suffix for
+        :param token: str, token we are searching for
+        :param nomenclate_object: nomenclate.core.nomenclate.Nomenclate, instance of nomenclate object to query
+        :param config_query_path: list(str), the query path to the suffixes in the config
+        :param return_type: type, the type of return value we want from the config
+        :param kwargs: any config settings that relate to the token as found from the nomenclate instance
+        :return: str, the matching suffix
+        """
+        try:
+            suffix_index = nomenclate_object.CFG.get_key_index(config_query_path)
+        except exceptions.ResourceNotFoundError:
+            suffix_index = None
+
+        if suffix_index is None:
+            return super(RenderType, cls).get_option(
+                engine_type, token, nomenclate_object, config_query_path, return_type, **kwargs
+            )
+
+        options = suffix_index.get(engine_type)
+        if options is None and isinstance(engine_type, str):
+            options = suffix_index.get(engine_type.lower())
+        return cls.process_criteria(token, options, **kwargs) if options else engine_type
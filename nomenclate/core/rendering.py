@@ -1,19 +1,38 @@
 #!/usr/bin/env python
-from collections import Counter
-import re
+from collections import Counter, OrderedDict
 import string
-import nomenclate.settings as settings
+from . import patterns
 from . import processing
+from . import tokens
+
+
+def render(format_string, token_values, nomenclate_object, settings=None):
+    """ Renders token values into a format string.  This is side effect free: neither the token values nor the
+        nomenclate object are modified so a single Nomenclate can be rendered from multiple threads at once.
+
+    :param format_string: str, the format string to render
+    :param token_values: dict, snapshot of the token state as serialized from nomenclate.core.tokens.TokenAttrList
+    :param nomenclate_object: nomenclate.core.nomenclature.Nomenclate, instance the renderers query for settings
+    :param settings: dict, config settings (e.g. version_padding) that only apply to this render
+    :return: str, the rendered name
+    """
+    render_context = RenderContext(nomenclate_object, token_values, settings=settings)
+    return InputRenderer.get_render_plan(format_string).render(render_context, token_values)
 
 
 class InputRenderer(type):
     RENDER_FUNCTIONS = {}
+    RESOLVED_RENDER_FUNCTIONS = {}
+    RENDER_PLANS = OrderedDict()
+    RENDER_PLAN_CACHE_SIZE = 256
 
     def __new__(mcs, name, bases, dct):
         cls = type.__new__(mcs, name, bases, dct)
         token = dct.get("token", None)
         if token:
             mcs.RENDER_FUNCTIONS[token] = cls
+            # A new renderer may supersede the renderer already resolved for any token name.
+            mcs.RESOLVED_RENDER_FUNCTIONS.clear()
         return cls
 
     @classmethod
@@ -33,7 +52,34 @@ class InputRenderer(type):
 
     @classmethod
     def get_valid_render_function(cls, token_name):
+        """ Gets the renderer that handles a token name (e.g. var2 is handled by the var renderer).
+            Resolutions are memoized per token name until another renderer is registered.
+
+        :param token_name: str, token name to find the renderer for
+        :return: nomenclate.core.renderers.RenderBase, renderer class for the token
+        """
         token_name = token_name.lower()
+        try:
+            return cls.RESOLVED_RENDER_FUNCTIONS[token_name]
+        except KeyError:
+            renderer = cls.RESOLVED_RENDER_FUNCTIONS[token_name] = cls._resolve_render_function(
+                token_name
+            )
+            return renderer
+
+    @classmethod
+    def get_resolved_render_functions(cls, token_names=None):
+        """ Gets the token name to renderer mapping.
+
+        :param token_names: list(str), token names to resolve first, otherwise only already resolved names are listed
+        :return: dict, token name: renderer class pairs
+        """
+        for token_name in token_names or []:
+            cls.get_valid_render_function(token_name)
+        return dict(cls.RESOLVED_RENDER_FUNCTIONS)
+
+    @classmethod
+    def _resolve_render_function(cls, token_name):
         renderer = None
 
         for func in list(cls.RENDER_FUNCTIONS):
@@ -44,32 +90,48 @@ class InputRenderer(type):
 
     @classmethod
     def render_nomenclative(cls, nomenclate_object):
-        nomenclative = processing.Nomenclative(nomenclate_object.format)
-        token_values = nomenclate_object.token_dict.to_json()
-        cls.render_unique_tokens(nomenclate_object, token_values)
-        render_template = nomenclate_object.format
-        cls._prepend_token_match_objects(token_values, render_template)
-        for token, match in token_values.items():
-            nomenclative.add_match(*match)
+        return render(nomenclate_object.format, nomenclate_object.state, nomenclate_object)
 
-        render_template = cls.cleanup_formatted_string(nomenclative.process_matches())
-        return render_template
+    @classmethod
+    def get_render_plan(cls, format_string):
+        """ Gets the compiled RenderPlan for the given format string, compiling and caching it on first request.
+            Only the RENDER_PLAN_CACHE_SIZE most recently used plans are kept.
+
+        :param format_string: str, the format string to get the render plan for
+        :return: RenderPlan, the (shared) compiled render plan
+        """
+        try:
+            render_plan = cls.RENDER_PLANS[format_string]
+            cls.RENDER_PLANS.move_to_end(format_string)
+        except KeyError:
+            render_plan = cls.RENDER_PLANS[format_string] = RenderPlan(format_string)
+            while len(cls.RENDER_PLANS) > cls.RENDER_PLAN_CACHE_SIZE:
+                cls.RENDER_PLANS.popitem(last=False)
+        return render_plan
 
     @classmethod
     def _prepend_token_match_objects(cls, token_values, incomplete_nomenclative):
         for token, token_settings in token_values.items():
             value = token_settings["label"]
-            regex_token = token.replace("(", "\(").replace(")", "\)")
-            re_token = settings.REGEX_TOKEN_SEARCH.format(
-                TOKEN=regex_token, TOKEN_CAPITALIZED=regex_token.capitalize()
-            )
-            re_matches = re.finditer(re_token, incomplete_nomenclative, 0)
-
-            for re_match in re_matches:
+            re_match = cls.find_token_match(token, incomplete_nomenclative)
+            if re_match:
                 token_values[token] = (re_match, value)
 
         cls._clear_non_matches(token_values)
 
+    @staticmethod
+    def find_token_match(token, format_string):
+        """ Finds where a token occurs in a format string, lower case or capitalized (camel cased).
+
+        :param token: str, token to search for
+        :param format_string: str, the format string to search
+        :return: (re.Match, None), the last match found in the format string or None
+        """
+        re_match = None
+        for re_match in patterns.token_search_pattern(token).finditer(format_string):
+            pass
+        return re_match
+
     @staticmethod
     def _clear_non_matches(token_values):
         to_delete = []
@@ -90,9 +152,9 @@ class InputRenderer(type):
         # Remove whitespace
         result = formatted_string.replace(" ", "")
         # Remove any static token parentheses
-        result = re.sub(settings.REGEX_PARENTHESIS, "", result)
+        result = patterns.PARENTHESIS.sub("", result)
         # Remove any multiple separator characters
-        multi_character_matches = re.finditer("[%s]{2,}" % settings.SEPARATORS, result)
+        multi_character_matches = patterns.MULTIPLE_SEPARATORS.finditer(result)
         for multi_character_match in sorted(
             multi_character_matches, key=lambda x: len(x.group()), reverse=True
         ):
@@ -102,9 +164,9 @@ class InputRenderer(type):
             ]
             result = result.replace(match, most_common_separator)
         # Remove trailing or preceding non letter characters
-        result = re.sub(settings.REGEX_ADJACENT_UNDERSCORE, "", result)
+        result = patterns.ADJACENT_UNDERSCORE.sub("", result)
         #  not sure what this one was...but certainly not it.
-        result = re.sub(settings.REGEX_SINGLE_PARENTHESIS, "", result)
+        result = patterns.SINGLE_PARENTHESIS.sub("", result)
         return result
 
     @staticmethod
@@ -125,3 +187,153 @@ class InputRenderer(type):
                     return [string.ascii_lowercase.index(query_string), "char_lo"]
             else:
                 raise IOError("The input is a string longer than one character")
+
+
+class RenderPlan(object):
+    """ A render plan compiled from a single format string.  Where each token sits in the format string (its slot)
+        and the static text in between are resolved once and memoized so repeated renders only have to render
+        the labels and substitute them into the precomputed slots.
+    """
+
+    def __init__(self, format_string):
+        self.format_string = format_string
+        self.token_slots = {}
+        self.layouts = {}
+
+    def get_token_slot(self, token):
+        """ Gets the regex match for the given token's slot in the format string.
+
+        :param token: str, token to query
+        :return: (re.Match, None), the match for the token's slot or None if it is not in the format string
+        """
+        try:
+            return self.token_slots[token]
+        except KeyError:
+            slot = self.token_slots[token] = InputRenderer.find_token_match(token, self.format_string)
+            return slot
+
+    @staticmethod
+    def get_renderer(token):
+        """ Gets the renderer class that handles the given token.
+
+        :param token: str, token to query
+        :return: nomenclate.core.renderers.RenderBase, renderer class for the token
+        """
+        return InputRenderer.get_valid_render_function(token)
+
+    def get_layout(self, tokens):
+        """ Gets the layout of the given (ordered) tokens within the format string, validating the
+            slots do not overlap the first time a combination of tokens is seen.
+
+        :param tokens: list(str), tokens that have a slot in the format string
+        :return: (list(str), list(str)), the tokens that are substituted sorted by slot position and the
+                                         static text segments surrounding them (always one more than the tokens)
+        """
+        layout_key = tuple(tokens)
+        try:
+            return self.layouts[layout_key]
+        except KeyError:
+            layout = self.layouts[layout_key] = self._build_layout(tokens)
+            return layout
+
+    def _build_layout(self, tokens):
+        nomenclative = processing.Nomenclative(self.format_string)
+        for token in tokens:
+            nomenclative.add_match(self.get_token_slot(token), "")
+
+        layout_tokens, segments, position = [], [], 0
+        token_matches = zip(tokens, nomenclative.token_matches)
+        for token, token_match in sorted(token_matches, key=lambda pair: pair[1].start):
+            # Static token matches are left in place
+            if token_match.match.startswith("(") or token_match.match.endswith(")"):
+                continue
+            segments.append(self.format_string[position : token_match.start])
+            layout_tokens.append(token)
+            position = token_match.end
+        segments.append(self.format_string[position:])
+        return layout_tokens, segments
+
+    def render(self, nomenclate_object, token_values):
+        """ Renders the given token values into the format string.
+
+        :param nomenclate_object: nomenclate.core.nomenclature.Nomenclate, instance the renderers query for settings
+        :param token_values: dict, token dictionary as serialized from nomenclate.core.tokens.TokenAttrList
+        :return: str, the rendered and cleaned up name
+        """
+        layout_tokens, segments = self.get_layout(
+            [token for token in token_values if self.get_token_slot(token)]
+        )
+        labels = [
+            self.render_token(token, token_values[token]["label"], nomenclate_object)
+            for token in layout_tokens
+        ]
+        return InputRenderer.cleanup_formatted_string(self.substitute(segments, labels))
+
+    def render_token(self, token, value, nomenclate_object):
+        renderer = self.get_renderer(token)
+        token_config = nomenclate_object.get_token_settings(token)
+        return str(renderer.render(value, token, nomenclate_object, **token_config))
+
+    @staticmethod
+    def substitute(segments, labels):
+        """ Interleaves the static text segments with the rendered labels.
+
+        :param segments: list(str), static text segments of the format string
+        :param labels: list(str), rendered labels, one less than segments
+        :return: str, the substituted string
+        """
+        substituted = [segments[0]]
+        for label, segment in zip(labels, segments[1:]):
+            substituted.append(label)
+            substituted.append(segment)
+        return "".join(substituted)
+
+
+class RenderContext(object):
+    """ A read only stand-in for a Nomenclate that renderers can query while rendering a snapshot of token values.
+        Token attributes are served from the snapshot and config settings from the optional settings overrides,
+        everything else is looked up on the wrapped Nomenclate which is never modified.
+    """
+
+    def __init__(self, nomenclate_object, token_values, settings=None, token_settings=None):
+        """
+
+        :param nomenclate_object: nomenclate.core.nomenclature.Nomenclate, instance to fall back on for config
+        :param token_values: dict, token dictionary as serialized from nomenclate.core.tokens.TokenAttrList
+        :param settings: dict, config settings (e.g. version_padding) that only apply to this render
+        :param token_settings: dict, memo of the nomenclate's token settings that can be shared between contexts
+        """
+        self.nomenclate_object = nomenclate_object
+        self.token_values = token_values
+        self.settings = settings or {}
+        self.token_settings = {} if token_settings is None else token_settings
+        self.token_attrs = {}
+
+    def get_token_settings(self, token):
+        try:
+            token_settings = self.token_settings[token]
+        except KeyError:
+            token_settings = self.token_settings[token] = self.nomenclate_object.get_token_settings(
+                token
+            )
+
+        if self.settings:
+            token_settings = dict(token_settings)
+            token_settings.update(
+                {key: value for key, value in self.settings.items() if "%s_" % token in key}
+            )
+        return token_settings
+
+    def __getattr__(self, item):
+        if item in self.token_values:
+            try:
+                return self.token_attrs[item]
+            except KeyError:
+                token_attr = self.token_attrs[item] = tokens.TokenAttr.from_json(
+                    self.token_values[item]
+                )
+                return token_attr
+
+        if item in self.settings:
+            return self.settings[item]
+        return getattr(self.nomenclate_object, item)
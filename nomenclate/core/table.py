@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+""" Column-wise storage of the token labels of many names of one format.
+
+    >>> import nomenclate
+    >>> from nomenclate.core.table import NameTable
+    >>> n = nomenclate.Nom(side='left', type='locator')
+    >>> table = NameTable(n, ({'name': 'obj%d' % i, 'var': i} for i in range(100000)))
+    >>> names = table.render()
+"""
+import itertools
+from collections import OrderedDict
+from . import errors as exceptions
+from . import rendering
+from . import tokens
+
+
+class NameTable(object):
+    """ Stores the token labels of many names of a single format as one column per token of the format order
+        instead of a Nomenclate, TokenAttrList and TokenAttrs per name.  Rendering goes column by column so every
+        renderer transforms a whole column at once before the columns are joined row by row into names.
+
+        The format, token state (case, prefix, suffix and any labels the rows leave unset) are snapshotted from the
+        Nomenclate when the table is created.
+    """
+
+    def __init__(self, nomenclate_object, rows=None, settings=None):
+        """
+
+        :param nomenclate_object: nomenclate.core.nomenclature.Nomenclate, instance to take the format and state from
+        :param rows: Iterable(dict), token:label pairs, one dictionary per name
+        :param settings: dict, config settings (e.g. version_padding) that only apply to this table's renders
+        """
+        self.nomenclate_object = nomenclate_object
+        self.format = nomenclate_object.format
+        self.token_values = nomenclate_object.state
+        self.settings = settings or {}
+        self.columns = OrderedDict((token.lower(), []) for token in nomenclate_object.format_order)
+        self.row_count = 0
+        if rows is not None:
+            self.extend(rows)
+
+    @property
+    def tokens(self):
+        return list(self.columns)
+
+    def append(self, row):
+        """ Adds a name to the table.  Tokens missing from the row (or set to None) use the Nomenclate's label.
+
+        :param row: dict, token:label pairs, same as the kwargs for Nomenclate.get
+        :raises: nomenclate.core.errors.ValidationError
+        """
+        labels = {}
+        for token, label in row.items():
+            token = token.lower()
+            if token not in self.columns:
+                raise exceptions.ValidationError(
+                    "Token %r is not in the table's format %r" % (token, self.format)
+                )
+            labels[token] = None if label is None else tokens.TokenAttr.convert_label(label)
+
+        for token, column in self.columns.items():
+            column.append(labels.get(token))
+        self.row_count += 1
+
+    def extend(self, rows):
+        """ Adds many names to the table.
+
+        :param rows: Iterable(dict), token:label pairs, one dictionary per name
+        """
+        for row in rows:
+            self.append(row)
+
+    def get_column(self, token):
+        """ Gets the labels for a token, with any labels unset by the rows filled in from the Nomenclate.
+
+        :param token: str, token to query
+        :return: list(str), one label per row
+        """
+        default = self.get_default_label(token)
+        try:
+            return [default if label is None else label for label in self.columns[token]]
+        except KeyError:
+            return [default] * self.row_count
+
+    def get_row(self, index):
+        """ Gets the labels of a single name.
+
+        :param index: int, row index
+        :return: dict, token:label pairs with any labels unset by the row filled in from the Nomenclate
+        """
+        row = {}
+        for token, column in self.columns.items():
+            label = column[index]
+            row[token] = self.get_default_label(token) if label is None else label
+        return row
+
+    def get_default_label(self, token):
+        """ Gets the label used for a token wherever a row leaves it unset, which is the Nomenclate's label.
+
+        :param token: str, token to query
+        :return: str, the default label
+        """
+        return self.token_values.get(token, {}).get("label", "")
+
+    def render(self):
+        """ Renders every name in the table.  Each token's column is rendered in one go by its renderer's
+            render_column then the rendered columns are substituted into the format row by row.
+
+        :return: list(str), the rendered names in row order
+        """
+        render_plan = rendering.InputRenderer.get_render_plan(self.format)
+        render_context = rendering.RenderContext(
+            self.nomenclate_object, self.token_values, settings=self.settings
+        )
+        layout_tokens, segments = render_plan.get_layout(
+            [token for token in self.token_values if render_plan.get_token_slot(token)]
+        )
+
+        rendered_columns = [
+            render_plan.get_renderer(token).render_column(
+                self.get_column(token),
+                token,
+                render_context,
+                **render_context.get_token_settings(token)
+            )
+            for token in layout_tokens
+        ]
+
+        rows = zip(*rendered_columns) if rendered_columns else itertools.repeat((), self.row_count)
+        return [
+            rendering.InputRenderer.cleanup_formatted_string(render_plan.substitute(segments, labels))
+            for labels in rows
+        ]
+
+    def __len__(self):
+        return self.row_count
@@ -1,4 +1,5 @@
 #!/usr/bin/env python
+from collections import OrderedDict
 from . import errors as exceptions
 import nomenclate.settings as settings
 from . import tools
@@ -16,8 +17,12 @@ class TokenAttr(tools.Serializable):
         token's label and any custom rendering syntax the user added) we will upper case the result and add
         either the given prefix or suffix no matter what.
 
+        TokenAttrs are slotted since a Nomenclate holds one per token and many names are often kept in memory.
+        Apart from the serialized state there are only slots for the padding and length settings callers may set.
+
     """
 
+    __slots__ = ("raw_string", "raw_token", "case", "prefix", "suffix", "padding", "length", "len")
     SERIALIZE_ATTRS = ["token", "label", "case", "prefix", "suffix"]
 
     def __init__(self, token="", label=None, case="", prefix="", suffix=""):
@@ -63,15 +68,40 @@ class TokenAttr(tools.Serializable):
 
     @label.setter
     def label(self, label):
-        self.validate_entries(label)
+        self.raw_string = self.convert_label(label)
+
+    @classmethod
+    def convert_label(cls, label):
+        """ Validates a label and converts it to the value it will be stored as (an int if possible)
+
+        :param label: (str, int), input label
+        :return: (str, int), stored label
+        """
+        cls.validate_entries(label)
         try:
-            self.raw_string = int(label)
+            return int(label)
         except ValueError:
-            self.raw_string = label
+            return label
 
     def set(self, value):
         self.label = value
 
+    def copy(self):
+        """ Copies the TokenAttr without revalidating its token or label.
+
+        :return: TokenAttr, the new instance
+        """
+        token_attr = self.__class__.__new__(self.__class__)
+        token_attr.raw_string = self.raw_string
+        token_attr.raw_token = self.raw_token
+        token_attr.case = self.case
+        token_attr.prefix = self.prefix
+        token_attr.suffix = self.suffix
+        for setting in ("padding", "length", "len"):
+            if hasattr(self, setting):
+                setattr(token_attr, setting, getattr(self, setting))
+        return token_attr
+
     @staticmethod
     def validate_entries(*entries):
         for entry in entries:
@@ -122,16 +152,53 @@ class TokenAttr(tools.Serializable):
 
 
 class TokenAttrList(tools.Serializable):
+    """ An ordered collection of TokenAttrs.  The TokenAttrs are stored in an ordered dictionary index keyed by
+        their (lower case) token so any token lookup is constant time, while token_attrs still gives them in order.
+
+    """
+
     def __init__(self, token_attrs):
         self.token_attrs = [TokenAttr(token_attr, "") for token_attr in token_attrs]
 
+    @property
+    def token_attrs(self):
+        """ Get or set the TokenAttrs.  They are returned as a tuple since the index is what holds them, use
+            merge_token_attr or purge_tokens to add or remove TokenAttrs.  Setting a new list rebuilds the token
+            index, where the first TokenAttr found for a token wins just like a lookup in the list would.
+
+        """
+        return tuple(self._token_index.values())
+
+    @token_attrs.setter
+    def token_attrs(self, token_attrs):
+        self._token_index = OrderedDict()
+        for token_attr in token_attrs:
+            self._token_index.setdefault(token_attr.token, token_attr)
+
+    def copy(self):
+        """ Copies the TokenAttrList and all of its TokenAttrs in token order.
+
+        :return: TokenAttrList, the new instance
+        """
+        token_attr_list = self.__class__.__new__(self.__class__)
+        token_attr_list._token_index = OrderedDict(
+            (token, token_attr.copy()) for token, token_attr in self._token_index.items()
+        )
+        return token_attr_list
+
+    def reindex(self):
+        """ Rebuilds the token index in place, needed if a TokenAttr's token has been changed directly.
+
+        """
+        self.token_attrs = self._token_index.values()
+
     def reset(self):
-        for token_attr in self.token_attrs:
+        for token_attr in self._token_index.values():
             token_attr.set("")
 
     @property
     def unset_token_attrs(self):
-        return [token_attr for token_attr in self.token_attrs if token_attr.label == ""]
+        return [token_attr for token_attr in self._token_index.values() if token_attr.label == ""]
 
     def purge_tokens(self, input_token_attrs=None):
         """ Removes all specified token_attrs that exist in instance.token_attrs
@@ -139,17 +206,11 @@ class TokenAttrList(tools.Serializable):
         :param token_attrs: list(str), list of string values of tokens to remove.  If None, removes all
         """
         if input_token_attrs is None:
-            remove_attrs = self.token_attrs
-        else:
-            remove_attrs = [
-                token_attr
-                for token_attr in self.token_attrs
-                if token_attr.token in input_token_attrs
-            ]
+            self._token_index.clear()
+            return
 
-        self.token_attrs = [
-            token_attr for token_attr in self.token_attrs if token_attr not in remove_attrs
-        ]
+        for token in [token for token in self._token_index if token in input_token_attrs]:
+            del self._token_index[token]
 
     @classmethod
     def from_json(cls, json_blob):
@@ -158,27 +219,60 @@ class TokenAttrList(tools.Serializable):
         return instance
 
     def merge_token_attr(self, token_attr):
-        if self.has_token_attr(token_attr):
-            getattr(self, token_attr.token).merge_json(token_attr.to_json())
+        existing_token_attr = self._token_index.get(token_attr.token)
+        if existing_token_attr is None:
+            self._token_index[token_attr.token] = token_attr
         else:
-            self.token_attrs.append(token_attr)
+            existing_token_attr.merge_json(token_attr.to_json())
 
     def has_token_attr(self, token):
-        return any([token_attr for token_attr in self.token_attrs if token_attr.token == token])
+        return token in self._token_index
 
     def merge_json(self, json_blob):
         for token_name, token_attr_blob in json_blob.items():
             token_name = token_name.lower()
-            try:
-                if not isinstance(token_attr_blob, dict):
-                    token_attr_blob = {"token": token_name, "label": token_attr_blob}
-
-                getattr(self, token_name).merge_serialization(token_attr_blob)
-            except (AttributeError, IndexError):
+            token_attr = self._token_index.get(token_name)
+            if not isinstance(token_attr_blob, dict):
+                if token_attr is not None:
+                    # Plain labels for existing tokens skip the serialization merge, with the same result
+                    token_attr.raw_token = token_name
+                    if token_attr_blob is not None:
+                        token_attr.label = token_attr_blob
+                    continue
+                token_attr_blob = {"token": token_name, "label": token_attr_blob}
+
+            if token_attr is None:
                 self.merge_token_attr(TokenAttr.from_json(token_attr_blob))
+            else:
+                token_attr.merge_serialization(token_attr_blob)
+                if token_attr.token != token_name:
+                    self.reindex()
 
     def to_json(self):
-        return {token_attr.token: token_attr.to_json() for token_attr in self.token_attrs}
+        return {token: token_attr.to_json() for token, token_attr in self._token_index.items()}
+
+    @staticmethod
+    def merge_token_values(token_values, json_blob):
+        """ Merges a json blob into a TokenAttrList serialization the same way merge_json would merge it into the
+            TokenAttrList itself, but without modifying either input.
+
+        :param token_values: dict, serialization of a TokenAttrList as returned by to_json
+        :param json_blob: dict, token: label or token: TokenAttr serialization pairs to merge
+        :return: dict, the merged serialization
+        """
+        merged_values = dict(token_values)
+        for token_name, token_attr_blob in json_blob.items():
+            token_name = token_name.lower()
+            if not isinstance(token_attr_blob, dict):
+                token_attr_blob = {"token": token_name, "label": token_attr_blob}
+
+            if token_name in merged_values:
+                token_attr = TokenAttr.from_json(merged_values[token_name])
+                token_attr.merge_json(token_attr_blob)
+            else:
+                token_attr = TokenAttr.from_json(token_attr_blob)
+            merged_values[token_attr.token] = token_attr.to_json()
+        return merged_values
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
@@ -194,16 +288,13 @@ class TokenAttrList(tools.Serializable):
         return False
 
     def __getattr__(self, item):
-        try:
-            return object.__getattribute__(self, item)
-        except AttributeError:
+        # Private attributes are never tokens, this also stops recursion before the index exists (e.g. copying)
+        if not item.startswith("_"):
             try:
-                return [token_attr for token_attr in self.token_attrs if token_attr.token == item][
-                    0
-                ]
-            except IndexError:
+                return self._token_index[item]
+            except KeyError:
                 pass
-        raise AttributeError
+        raise AttributeError(item)
 
     def __str__(self):
         return " ".join(
@@ -214,7 +305,10 @@ class TokenAttrList(tools.Serializable):
         return "<%s %s>" % (self.__class__.__name__, self.token_attrs)
 
     def __iter__(self):
-        return iter(self.token_attrs)
+        return iter(self._token_index.values())
 
     def __getitem__(self, item):
-        return [token_attr for token_attr in self.token_attrs if token_attr.token == item][0]
+        try:
+            return self._token_index[item]
+        except KeyError:
+            raise IndexError(item)
@@ -2,6 +2,8 @@ import collections
 
 
 class Serializable(object):
+    # Empty slots so subclasses are free to define __slots__ without also getting a __dict__
+    __slots__ = ()
     SERIALIZE_ATTRS = []
 
     def serialize(self):
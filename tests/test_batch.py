@@ -0,0 +1,62 @@
+import mock
+import nomenclate as nm
+import nomenclate.batch as batch
+from tests.basetest import TestBase
+
+
+class TestBatchBase(TestBase):
+    def setUp(self):
+        super(TestBatchBase, self).setUp()
+        self.nom = nm.Nom({'side': 'left', 'type': 'locator', 'var': 0})
+        self.nom.var.case = 'upper'
+        self.token_dicts = [{'name': 'obj%d' % index, 'var': index} for index in range(50)]
+        self.expected = list(self.nom.get_many(self.token_dicts))
+        self.fixtures.extend([self.nom, self.token_dicts])
+
+
+class TestChunk(TestBatchBase):
+    def test_chunk(self):
+        self.assertEquals(list(batch.chunk(range(5), 2)), [[0, 1], [2, 3], [4]])
+
+    def test_chunk_empty(self):
+        self.assertEquals(list(batch.chunk([], 2)), [])
+
+
+class TestRenderBatch(TestBatchBase):
+    def test_processes(self):
+        self.assertEquals(list(batch.render_batch(self.nom, self.token_dicts, workers=2, chunk_size=7)),
+                          self.expected)
+
+    def test_threads(self):
+        self.assertEquals(list(batch.render_batch(self.nom, self.token_dicts, workers=2, chunk_size=7,
+                                                  use_threads=True)),
+                          self.expected)
+
+    def test_progress_callback(self):
+        progress = []
+        list(batch.render_batch(self.nom, self.token_dicts, workers=2, chunk_size=20,
+                                progress_callback=progress.append, use_threads=True))
+        self.assertEquals(progress, [20, 40, 50])
+
+    def test_seeded_settings(self):
+        self.nom.format = 'name_version'
+        self.nom.date_format = '%Y'
+        renderer = batch.BatchRenderer(self.nom, workers=1)
+        seed = batch.get_seed(self.nom)
+        self.assertEquals(seed['attributes'], {'date_format': '%Y'})
+        self.assertIn('version_padding', seed['settings'])
+        self.assertEquals(list(renderer.render([{'name': 'a', 'version': 2}])), [self.nom.get(name='a', version=2)])
+
+    def test_worker_config_from_seed(self):
+        seed = batch.get_seed(self.nom)
+        cfg = self.nom.CFG
+        with mock.patch.object(batch.Nomenclate, 'CFG', cfg), \
+                mock.patch.object(batch, '_worker_nomenclate', None), \
+                mock.patch.object(batch.config.ConfigParse, 'set_from_file') as set_from_file:
+            batch.initialize_worker(seed)
+            self.assertIsNot(batch.Nomenclate.CFG, cfg)
+            self.assertEquals(dict(batch.Nomenclate.CFG.config), dict(cfg.config))
+        set_from_file.assert_not_called()
+
+    def test_invalid_chunk_size(self):
+        self.assertRaises(ValueError, batch.BatchRenderer, self.nom, chunk_size=0)
@@ -1,10 +1,13 @@
 import mock
 import os
 import json
+import threading
+import time
 from tempfile import mkstemp
 from pyfakefs import fake_filesystem
 from collections import OrderedDict
 import nomenclate.core.configurator as config
+import nomenclate.core.file_utils as file_utils
 import nomenclate.core.errors as exceptions
 from tests.basetest import TestBase
 
@@ -171,6 +174,170 @@ class TestGetDefaultConfigFile(TestConfiguratorBase):
     #     self.assertRaises(exceptions.SourceError, config.ConfigParse)
 
 
+class TestSharedConfig(TestConfiguratorBase):
+    def test_shared(self):
+        self.assertIs(config.get_shared_config(), config.get_shared_config())
+
+    def test_descriptor(self):
+        class Owner(object):
+            CFG = config.SharedConfig()
+            SIDES = config.SharedConfigEntry(["options", "side"])
+            resets = []
+
+            @classmethod
+            def reset_from_config(cls):
+                cls.resets.append(cls.CFG)
+
+        self.assertEquals(Owner.resets, [])
+        self.assertIs(Owner.CFG, config.get_shared_config())
+        self.assertIs(Owner().CFG, config.get_shared_config())
+        self.assertEquals(Owner.resets, [config.get_shared_config()])
+        self.assertEquals(Owner.SIDES, config.get_shared_config().get(["options", "side"]))
+
+    def test_threads_wait_for_initialization(self):
+        class Owner(object):
+            CFG = config.SharedConfig()
+            ready = False
+
+            @classmethod
+            def reset_from_config(cls):
+                cls.CFG
+                time.sleep(0.05)
+                cls.ready = True
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append((Owner.CFG, Owner.ready))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEquals(results, [(config.get_shared_config(), True)] * 8)
+
+    def test_failed_initialization_retried(self):
+        class Owner(object):
+            CFG = config.SharedConfig()
+            resets = []
+
+            @classmethod
+            def reset_from_config(cls):
+                cls.resets.append(True)
+                if len(cls.resets) == 1:
+                    raise exceptions.ResourceNotFoundError("mock: reset failed")
+
+        self.assertRaises(exceptions.ResourceNotFoundError, getattr, Owner, "CFG")
+        self.assertIs(Owner.CFG, config.get_shared_config())
+        self.assertEquals(len(Owner.resets), 2)
+
+    def test_loaded_once_across_threads(self):
+        set_from_file = config.ConfigParse.set_from_file
+
+        def slow_set_from_file(config_parse, config_filename):
+            time.sleep(0.05)
+            return set_from_file(config_parse, config_filename)
+
+        results = []
+        with mock.patch.dict(config._shared_configs, clear=True), \
+                mock.patch.object(config.ConfigParse, "set_from_file", autospec=True,
+                                  side_effect=slow_set_from_file) as mock_set_from_file:
+            threads = [threading.Thread(target=lambda: results.append(config.get_shared_config()))
+                       for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEquals(mock_set_from_file.call_count, 1)
+        self.assertEquals(len(set(map(id, results))), 1)
+
+    def test_instance_override(self):
+        class Owner(object):
+            CFG = config.SharedConfig()
+
+        owner = Owner()
+        owner.CFG = self.cfg
+        self.assertIs(owner.CFG, self.cfg)
+        self.assertIs(Owner.CFG, config.get_shared_config())
+
+
+class TestConfigFileCache(TestConfiguratorBase):
+    def setUp(self):
+        super(TestConfigFileCache, self).setUp()
+        fd, self.temp_path = mkstemp(suffix=".yml")
+        os.close(fd)
+        self.write_config({"name": "john"}, mtime=1000)
+
+    def tearDown(self):
+        super(TestConfigFileCache, self).tearDown()
+        os.remove(self.temp_path)
+
+    def write_config(self, data, mtime):
+        with open(self.temp_path, "w") as f:
+            f.write(json.dumps(data))
+        os.utime(self.temp_path, (mtime, mtime))
+
+    @mock.patch("nomenclate.core.file_utils.yaml.safe_load", side_effect=file_utils.yaml.safe_load)
+    def test_parsed_once(self, mock_safe_load):
+        config.ConfigParse(config_filename=self.temp_path)
+        config.ConfigParse(config_filename=self.temp_path)
+        self.assertEquals(mock_safe_load.call_count, 1)
+
+    def test_refresh(self):
+        custom_config = config.ConfigParse(config_filename=self.temp_path)
+        self.write_config({"name": "kate"}, mtime=2000)
+        self.assertEquals(custom_config.get("name", return_type=str), "john")
+        custom_config.refresh()
+        self.assertEquals(custom_config.get("name", return_type=str), "kate")
+
+    def test_changed_while_loading(self):
+        load_yaml_file = config.load_yaml_file
+
+        def load_then_change(file_path):
+            data = load_yaml_file(file_path)
+            self.write_config({"name": "kate"}, mtime=2000)
+            return data
+
+        with mock.patch.object(config, "load_yaml_file", side_effect=load_then_change):
+            custom_config = config.ConfigParse(config_filename=self.temp_path)
+        self.assertEquals(custom_config.get("name", return_type=str), "john")
+        custom_config.refresh()
+        self.assertEquals(custom_config.get("name", return_type=str), "kate")
+
+    def test_shared_by_resolved_path(self):
+        shared_config = config.get_shared_config(self.temp_path)
+        self.assertIs(config.get_shared_config(os.path.realpath(self.temp_path)), shared_config)
+        self.write_config({"name": "kate"}, mtime=2000)
+        self.assertEquals(config.get_shared_config(self.temp_path).get("name", return_type=str), "kate")
+
+
+class TestKeyIndex(TestBase):
+    def setUp(self):
+        super(TestKeyIndex, self).setUp()
+        self.cfg = config.ConfigParse(data=[('suffixes', {'modeling': {'mesh': ['MH', 'MSH'], 'Curve': ['CR']},
+                                                            'rigging': {'joint': ['JT', 'JNT'],
+                                                                        'mesh': ['RMH']}}),
+                                            ('options', ['a', 'b'])])
+        self.fixtures.append(self.cfg)
+
+    def test_matches_search(self):
+        index = self.cfg.get_key_index(['suffixes'])
+        suffixes = self.cfg.get(['suffixes'], return_type=dict)
+        for key in ['mesh', 'joint', 'modeling', 'Curve']:
+            self.assertEquals(index[key], list(config.flatten(config.gen_dict_key_matches(key, suffixes))))
+
+    def test_case_insensitive(self):
+        self.assertEquals(self.cfg.get_key_index(['suffixes'])['curve'], ['CR'])
+
+    def test_built_once(self):
+        self.assertIs(self.cfg.get_key_index(['suffixes']), self.cfg.get_key_index(['suffixes']))
+
+    def test_invalid_path(self):
+        self.assertRaises(exceptions.ResourceNotFoundError, self.cfg.get_key_index, ['nothing'])
+
+    def test_reset_on_set_from_dict(self):
+        self.cfg.get_key_index(['suffixes'])
+        self.cfg.set_from_dict([('suffixes', {'joint': ['J']})])
+        self.assertEquals(self.cfg.get_key_index(['suffixes'])['joint'], ['J'])
+
+
 class TestGetHandler(TestConfiguratorBase):
     def test_existing(self):
         config.ConfigEntryFormatter.get_handler(str, list)
@@ -16,3 +16,38 @@ class TestFormatStringValidateFormatString(TestFormatStringBase):
 
     def test_get__validate_format_string__is_format_invalid(self):
         self.assertRaises(exceptions.FormatError, self.fs.get_valid_format_order, 'notside;blah')
+
+
+class TestFormatStringCopyFormat(TestFormatStringBase):
+    def test_copy_format(self):
+        other = formatter.FormatString('side_nameVar')
+        self.fs.copy_format(other)
+        self.assertEquals((str(self.fs), self.fs.format_order), ('side_nameVar', ['side', 'name', 'Var']))
+
+    def test_copy_is_independent(self):
+        other = formatter.FormatString('side_name')
+        self.fs.copy_format(other)
+        self.fs.format_order.append('type')
+        self.assertEquals(other.format_order, ['side', 'name'])
+
+
+class TestFormatStringParsedFormat(TestFormatStringBase):
+    def test_shared_parse(self):
+        self.assertIs(formatter.FormatString.get_parsed_format('side_nameVar'),
+                      formatter.FormatString.get_parsed_format('side_nameVar'))
+
+    def test_parse(self):
+        self.assertEquals(formatter.FormatString.get_parsed_format('side_nameVar'),
+                          ('side_nameVar', ('side', 'name', 'Var')))
+
+    def test_instances_do_not_share_order(self):
+        fs = formatter.FormatString('side_name')
+        fs.format_order.append('type')
+        self.assertEquals(formatter.FormatString('side_name').format_order, ['side', 'name'])
+
+    def test_invalid_raises(self):
+        for _ in range(2):
+            self.assertRaises(exceptions.FormatError, formatter.FormatString.get_parsed_format, 'notside;blah')
+
+    def test_not_a_string(self):
+        self.assertRaises(exceptions.FormatError, formatter.FormatString.get_parsed_format, ['side'])
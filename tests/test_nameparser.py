@@ -1,3 +1,4 @@
+import mock
 import unittest
 import itertools
 import datetime
@@ -278,3 +279,87 @@ class TestNameparser(TestBase):
             if result:
                 result = result['match_int']
             self.assertEquals(result, test_value)
+
+
+class TestNameparserParseNames(TestBase):
+    def setUp(self):
+        super(TestNameparserParseNames, self).setUp()
+        self.names = ['nurs_enchant_lilies_hi_cn_flowers_receptacle_a_1002_tg',
+                      'HKY_010_lighting_v007.hip',
+                      'hello_l_v03_2017-03-16',
+                      'leftArm_2010_12_05']
+
+    def test_parse_names_streams(self):
+        results = np.NameParser.parse_names(iter(self.names))
+        self.assertFalse(isinstance(results, list))
+        self.assertEquals(list(results), [np.NameParser.parse_name(name) for name in self.names])
+
+    def test_parse_names_empty(self):
+        self.assertEquals(list(np.NameParser.parse_names([])), [])
+
+    def test_side_matcher_built_once(self):
+        self.assertIs(np.NameParser.get_side_matcher(), np.NameParser.get_side_matcher())
+
+    def test_side_matcher_custom_sides(self):
+        side_matcher = np.NameParser.get_side_matcher(['up'])
+        self.assertEquals([side for side, _ in side_matcher.options], ['up'])
+        self.assertEquals(np.NameParser.get_side('spine_up_v01', side_matcher=side_matcher)['side'], 'up')
+
+    def test_date_patterns_follow_formats(self):
+        self.assertEquals([time_format for _, time_format in np.NameParser.get_date_patterns()],
+                          np.NameParser.DATE_FORMATS)
+
+
+class TestAbbreviationMatcher(TestBase):
+    def setUp(self):
+        super(TestAbbreviationMatcher, self).setUp()
+        self.fixture = np.AbbreviationMatcher([('left', [('l', []), ('le', []), ('left', []), ('lt', [])]),
+                                               ('right', [('r', []), ('rt', [])])])
+
+    def test_build_trie_regex(self):
+        self.assertEquals(self.fixture._build_trie_regex(['l', 'le', 'left']), 'l(?:e(?:ft)?)?')
+
+    def test_find_abbreviations_prefixes(self):
+        self.assertEquals(self.fixture.find_abbreviations('arm_LEFT_v01'), {'l', 'le', 'left', 'r'})
+
+    def test_find_abbreviations_overlapping(self):
+        self.assertEquals(self.fixture.find_abbreviations('xlrt'), {'l', 'r', 'rt'})
+
+    def test_find_abbreviations_none(self):
+        self.assertEquals(self.fixture.find_abbreviations('spine_c_v01'), set())
+
+    def test_find_abbreviations_empty_options(self):
+        self.assertEquals(np.AbbreviationMatcher([]).find_abbreviations('left'), set())
+
+
+class TestNameparserDateEngine(TestBase):
+    def test_get_date_priority_over_position(self):
+        result = np.NameParser.get_date('03_16_2017_hello_2017-03-16')
+        self.assertEquals(result['format'], '%Y-%m-%d')
+        self.assertEquals(result['position'], (17, 27))
+        self.assertEquals(result['datetime'], datetime.datetime(2017, 3, 16))
+
+    def test_get_date_falls_back_on_invalid_date(self):
+        result = np.NameParser.get_date('hello_2017-13-45_03_16_2017')
+        self.assertEquals(result['format'], '%m_%d_%Y')
+        self.assertEquals(result['match'], '03_16_2017')
+
+    def test_get_date_none(self):
+        self.assertIsNone(np.NameParser.get_date('HKY_010_lighting_v007.hip'))
+
+    def test_get_date_pattern_matches_format(self):
+        result = np.NameParser.get_date('hello_l_v03_2017-03-16')
+        self.assertIn((result['pattern'], result['format']), np.NameParser.get_date_patterns())
+
+    def test_parse_name_searches_date_once(self):
+        with mock.patch.object(np.NameParser, 'get_date', wraps=np.NameParser.get_date) as get_date:
+            np.NameParser.parse_name('hello_l_v03_2017-03-16')
+        self.assertEquals(get_date.call_count, 1)
+
+    def test_parse_name_version_ignores_date(self):
+        self.assertEquals(np.NameParser.parse_name('hello_v03_2017-03-16')['version']['version'], 3)
+
+    def test_strptime_cached(self):
+        self.assertIs(np.NameParser._strptime('2017-03-16', '%Y-%m-%d'),
+                      np.NameParser._strptime('2017-03-16', '%Y-%m-%d'))
+        self.assertIsNone(np.NameParser._strptime('2017-13-45', '%Y-%m-%d'))
@@ -1,6 +1,9 @@
 import unittest
+import mock
 import nomenclate as nm
 import nomenclate.core.configurator as config
+import nomenclate.core.errors as errors
+import nomenclate.core.nomenclature as nomenclature
 from tests.basetest import TestBase
 
 
@@ -227,6 +230,118 @@ class TestNomenclateSwapFormats(TestNomenclateBase):
         self.nom.side.case = "upper"
 
 
+class TestNomenclateFormatCache(TestNomenclateBase):
+    raf_path = ["naming_formats", "riggers", "raffaele_fragapane"]
+
+    def test_config_path_cached(self):
+        self.assertEquals(self.nom.get_format_string(self.raf_path), "name_heightSideDepth_purpose")
+        with mock.patch.object(self.cfg, "get") as get:
+            self.assertEquals(self.nom.get_format_string(list(self.raf_path)), "name_heightSideDepth_purpose")
+        get.assert_not_called()
+
+    def test_format_string_cached(self):
+        self.assertEquals(self.nom.get_format_string("side_name_type"), "side_name_type")
+        with mock.patch.object(self.cfg, "get") as get:
+            self.assertEquals(self.nom.get_format_string("side_name_type"), "side_name_type")
+        get.assert_not_called()
+
+    def test_cache_emptied_with_config(self):
+        self.nom.get_format_string(self.raf_path)
+        self.cfg.set_from_dict(list(self.cfg.config.items()))
+        self.assertEquals(self.cfg.format_cache, {})
+
+    def test_cache_bounded(self):
+        with mock.patch.object(self.nom, "FORMAT_TARGET_CACHE_SIZE", 2):
+            self.nom.get_format_string(self.raf_path)
+            self.nom.get_format_string("side_name")
+            self.nom.get_format_string(self.raf_path)
+            self.nom.get_format_string("side_type")
+        self.assertEquals(list(self.cfg.format_cache), [tuple(self.raf_path), "side_type"])
+
+    def test_invalid_swap(self):
+        self.assertRaises(errors.BalanceError, setattr, self.nom, "format", "side_(name")
+        self.assertEquals(self.nom.format, nm.Nom().format)
+
+    def test_swap_back_and_forth(self):
+        self.nom.format = "side_name_lod"
+        self.nom.lod = 2
+        self.nom.format = "side_name_type"
+        self.assertEquals(self.nom.get(), "l_testObject")
+        self.nom.format = "side_name_lod"
+        self.assertEquals(self.nom.state["lod"]["label"], "")
+        self.assertEquals(self.nom.tokens[-1].token, "lod")
+
+
+class TestNomenclateClone(TestNomenclateBase):
+    def test_same_name(self):
+        self.assertEquals(self.nom.clone().get(), self.nom.get())
+
+    def test_state_and_format(self):
+        clone = self.nom.clone()
+        self.assertEquals(clone.state, self.nom.state)
+        self.assertEquals((clone.format, clone.format_order), (self.nom.format, self.nom.format_order))
+
+    def test_independent_tokens(self):
+        clone = self.nom.clone()
+        clone.side = "right"
+        clone.var.case = "lower"
+        self.assertEquals((self.nom.side.label, self.nom.var.case), ("left", "upper"))
+
+    def test_independent_format(self):
+        clone = self.nom.clone()
+        clone.format = "side_name_lod"
+        self.assertEquals(self.nom.format, self.test_format)
+        self.assertIn("type", self.nom.state)
+
+    def test_merge_inputs(self):
+        clone = self.nom.clone({"side": "right"}, name="other")
+        self.assertEquals((clone.side.label, clone.name.label), ("right", "other"))
+        self.assertEquals(self.nom.name.label, "testObject")
+
+    def test_instance_settings(self):
+        self.nom.date_format = "%Y"
+        clone = self.nom.clone()
+        self.assertEquals(clone.date_format, "%Y")
+        self.assertIs(clone.CFG, self.cfg)
+
+    def test_no_config_resolution(self):
+        self.nom.CFG = None
+        self.assertEquals(self.nom.clone().format, self.test_format)
+
+
+class TestNomenclateSiftConfigs(TestNomenclateBase):
+    def test_key_types(self):
+        format_tokens = frozenset(["side", "name", "var"])
+        self.assertEquals(
+            [nm.Nom.get_key_type(key, format_tokens) for key in ["side", "var_format", "weird"]],
+            [nm.Nom.TOKEN_KEY, nm.Nom.CONFIG_KEY, nm.Nom.UNKNOWN_KEY],
+        )
+
+    def test_key_types_memoized(self):
+        format_tokens = frozenset(["side", "name"])
+        nm.Nom.get_key_type("side_case", format_tokens)
+        hits = nm.Nom.get_key_type.cache_info().hits
+        self.assertEquals(nm.Nom.get_key_type("side_case", format_tokens), nm.Nom.CONFIG_KEY)
+        self.assertEquals(nm.Nom.get_key_type.cache_info().hits, hits + 1)
+
+    def test_key_types_bounded(self):
+        self.assertEquals(nm.Nom.get_key_type.cache_info().maxsize, nomenclature.KEY_TYPE_CACHE_SIZE)
+
+    def test_key_types_per_format(self):
+        self.assertEquals(nm.Nom.get_key_type("version_padding", frozenset(["version"])), nm.Nom.CONFIG_KEY)
+        self.assertEquals(nm.Nom.get_key_type("version_padding", frozenset(["side"])), nm.Nom.UNKNOWN_KEY)
+
+    def test_sift(self):
+        input_dict = {"side": "left", "var_format": "a", "weird": "nope"}
+        self.assertEquals(self.nom._sift_configs(input_dict), {"var_format": "a"})
+        self.assertEquals(input_dict, {"side": "left", "weird": "nope"})
+
+    def test_sift_follows_format(self):
+        self.nom.format = "name_version"
+        input_dict = {"version_padding": 2, "var_format": "a"}
+        self.assertEquals(self.nom._sift_configs(input_dict), {"version_padding": 2})
+
+
 class TestNomenclateInitializeOptions(TestNomenclateBase):
     def test_options_stored(self):
         nm.Nom.CONFIG_OPTIONS = None
@@ -272,6 +387,59 @@ class TestNomenclateGet(TestNomenclateBase):
         self.nom.state = previous_state
 
 
+class TestNomenclateGetStateless(TestNomenclateBase):
+    def test_get_kwargs_do_not_persist(self):
+        previous_state = self.nom.state
+        self.assertEquals(self.nom.get(side="right", weird="nope"), "r_testObjectA_LOC")
+        self.assertEquals(self.nom.state, previous_state)
+
+    def test_get_threaded(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        sides = ["left", "right", "center"] * 20
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lambda side: self.nom.get(side=side), sides))
+        self.assertEquals(results, ["%s_testObjectA_LOC" % side[0] for side in sides])
+
+
+class TestNomenclateGetMany(TestNomenclateBase):
+    def test_get_many(self):
+        self.assertEquals(
+            list(self.nom.get_many([{}, {"side": "right"}, {"name": "other", "location": "rear"}])),
+            ["l_testObjectA_LOC", "r_testObjectA_LOC", "l_rr_otherA_LOC"],
+        )
+
+    def test_get_many_matches_get(self):
+        token_dicts = [{"var": 3}, {"type": "joint", "var": {"label": 1, "case": "lower"}}]
+        self.assertEquals(
+            list(self.nom.get_many(token_dicts)),
+            [self.nom.get(**token_dict) for token_dict in token_dicts],
+        )
+
+    def test_get_many_state_unchanged(self):
+        previous_state = self.nom.state
+        list(self.nom.get_many([{"side": "right", "weird": "nope"}, {"var": 5}]))
+        self.assertEquals(self.nom.state, previous_state)
+
+    def test_get_many_empty(self):
+        self.assertEquals(list(self.nom.get_many([])), [])
+
+
+class TestNomenclateSerialization(TestNomenclateBase):
+    def test_to_json(self):
+        self.assertEquals(
+            self.nom.to_json(),
+            {"format_string_object": {"format_string": self.nom.format}, "token_dict": self.nom.state},
+        )
+
+    def test_from_json(self):
+        self.nom.format = self.test_format_b
+        other = nm.Nom.from_json(self.nom.to_json())
+        self.assertEquals(other.format, self.test_format_b)
+        self.assertTrue(other == self.nom)
+        self.assertEquals(other.get(), self.nom.get())
+
+
 class TestNomenclateEq(TestNomenclateBase):
     def test_equal(self):
         other = nm.Nom(self.nom)
@@ -336,6 +504,42 @@ class TestNomenclateTokens(TestNomenclateBase):
         self.checkEqual(nom.tokens, list(self.empty_vars))
 
 
+class TestNomenclateTokenAttributes(TestNomenclateBase):
+    def test_format_tokens(self):
+        self.assertEquals(self.nom._format_tokens, set(token.lower() for token in self.nom.format_order))
+
+    def test_format_tokens_follow_swap(self):
+        self.nom.format = "name_version"
+        self.assertEquals(self.nom._format_tokens, {"name", "version"})
+
+    def test_set_token(self):
+        self.nom.side = "right"
+        self.assertEquals(self.nom.token_dict.side.label, "right")
+        self.assertNotIn("side", vars(self.nom))
+
+    def test_set_token_after_swap(self):
+        self.nom.format = "name_version"
+        self.nom.version = 3
+        self.assertEquals(self.nom.token_dict.version.label, 3)
+
+    def test_set_old_token_after_swap(self):
+        self.nom.format = "name_version"
+        self.nom.side = "right"
+        self.assertEquals(vars(self.nom)["side"], "right")
+        self.assertFalse(self.nom.token_dict.has_token_attr("side"))
+
+    def test_set_missing_token_merges(self):
+        self.nom.token_dict.purge_tokens(["side"])
+        self.nom.side = "right"
+        self.assertEquals(self.nom.token_dict.side.label, "right")
+
+    def test_get_token(self):
+        self.assertIs(self.nom.side, self.nom.token_dict.side)
+
+    def test_get_missing(self):
+        self.assertRaises(AttributeError, getattr, self.nom, "not_a_token")
+
+
 class TestNomenclateDir(TestNomenclateBase):
     def test_default(self):
         nom = nm.Nom()
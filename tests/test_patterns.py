@@ -0,0 +1,39 @@
+import re
+import nomenclate.core.patterns as patterns
+from tests.basetest import TestBase
+
+
+class TestPatternsBase(TestBase):
+    def setUp(self):
+        super(TestPatternsBase, self).setUp()
+        patterns.clear_caches()
+
+
+class TestCompilePattern(TestPatternsBase):
+    def test_compiled(self):
+        self.assertEquals(patterns.compile_pattern(r'te(s)t').pattern, r'te(s)t')
+
+    def test_cached(self):
+        self.assertIs(patterns.compile_pattern(r'test'), patterns.compile_pattern(r'test'))
+
+    def test_flags(self):
+        self.assertEquals(patterns.compile_pattern(r'test', flags=re.IGNORECASE).flags & re.IGNORECASE,
+                          re.IGNORECASE)
+
+
+class TestTokenSearchPattern(TestPatternsBase):
+    def test_camel(self):
+        self.assertEquals(patterns.token_search_pattern('var').search('nameVar').group('token'), 'Var')
+
+    def test_static(self):
+        self.assertEquals(patterns.token_search_pattern('(v)').search('name_(v)').group('token'), '(v)')
+
+
+class TestCacheStats(TestPatternsBase):
+    def test_stats(self):
+        patterns.compile_pattern(r'test')
+        patterns.compile_pattern(r'test')
+        patterns.token_search_pattern('name')
+        stats = patterns.get_cache_stats()
+        self.assertEquals((stats['compile_pattern'].hits, stats['compile_pattern'].misses), (1, 1))
+        self.assertEquals((stats['token_search_pattern'].hits, stats['token_search_pattern'].misses), (0, 1))
@@ -112,3 +112,44 @@ class TokenMatchAdjustPosition(TokenMatchBase):
 
     def test_invalid_type(self):
         self.assertRaises(IOError, self.token_match_start.adjust_position, 5)
+
+
+class NomenclativeSortedMatches(TestBase):
+    def setUp(self):
+        super(NomenclativeSortedMatches, self).setUp()
+        self.format_string = 'side_(v)version_name_type'
+        self.nomenclative = processing.Nomenclative(self.format_string)
+        self.fixtures.append(self.nomenclative)
+
+    def get_match(self, token):
+        return re.compile(r'(?P<token>%s)' % re.escape(token)).search(self.format_string)
+
+    def test_out_of_order(self):
+        for token, sub in [('type', 'GRP'), ('side', 'l'), ('name', 'arm')]:
+            self.nomenclative.add_match(self.get_match(token), sub)
+        self.assertEquals(self.nomenclative.process_matches(), 'l_(v)version_arm_GRP')
+
+    def test_static_left_in_place(self):
+        self.nomenclative.add_match(self.get_match('(v)'), 'x')
+        self.nomenclative.add_match(self.get_match('name'), 'arm')
+        self.assertEquals(self.nomenclative.process_matches(), 'side_(v)version_arm_type')
+
+    def test_repeatable(self):
+        self.nomenclative.add_match(self.get_match('name'), 'a_longer_name')
+        self.assertEquals(self.nomenclative.process_matches(), self.nomenclative.process_matches())
+
+    def test_overlap_neighbours(self):
+        self.nomenclative.add_match(self.get_match('side'), 'l')
+        self.nomenclative.add_match(self.get_match('type'), 'GRP')
+        self.assertRaises(exceptions.OverlapError, self.nomenclative.add_match, self.get_match('ame_ty'), 'x')
+        self.assertEquals(len(self.nomenclative.token_matches), 2)
+
+    def test_validate_matches_direct_append(self):
+        self.nomenclative.add_match(self.get_match('name'), 'arm')
+        self.nomenclative.token_matches.append(processing.TokenMatch(self.get_match('ame_ty'), 'x'))
+        self.assertRaises(exceptions.OverlapError, self.nomenclative.validate_matches)
+
+    def test_sorted_matches(self):
+        for token in ['type', 'side', 'name']:
+            self.nomenclative.add_match(self.get_match(token), token)
+        self.assertEquals([m.match for m in self.nomenclative.get_sorted_matches()], ['side', 'name', 'type'])
@@ -1,8 +1,11 @@
+import datetime
+import mock
 import nomenclate.core.rendering as rendering
 import nomenclate.core.renderers as renderers
 import nomenclate.core.processing as processing
 import nomenclate.core.tokens as tokens
 import nomenclate.core.nomenclature as nom
+import nomenclate.core.errors as exceptions
 from tests.basetest import TestBase
 
 
@@ -127,6 +130,51 @@ class TestInputRendererGetVariationId(TestInputRendererBase):
     def test_get_variation_id_double_lower(self):
         self.assertEquals(renderers.RenderVar._get_variation_id(1046, capital=False), 'ang')
 
+    def test_get_variation_id_large_index_exact(self):
+        value = 26 ** 30 + 12345
+        self.assertEquals(renderers.RenderVar.get_variation_index(renderers.RenderVar._get_variation_id(value)),
+                          value)
+
+
+class TestRenderVarGetVariationIds(TestInputRendererBase):
+    def test_matches_single_ids(self):
+        self.assertEquals(list(renderers.RenderVar.get_variation_ids(0, 20000)),
+                          [renderers.RenderVar._get_variation_id(i) for i in range(20000)])
+
+    def test_carry_adds_letter(self):
+        self.assertEquals(list(renderers.RenderVar.get_variation_ids(700, 703)), ['zy', 'zz', 'aaa'])
+
+    def test_capital(self):
+        self.assertEquals(list(renderers.RenderVar.get_variation_ids(1046, 1048, capital=True)), ['ANG', 'ANH'])
+
+    def test_negative_start(self):
+        self.assertEquals(list(renderers.RenderVar.get_variation_ids(-2, 2)), ['', '', 'a', 'b'])
+
+    def test_empty_range(self):
+        self.assertEquals(list(renderers.RenderVar.get_variation_ids(5, 2)), [])
+
+    def test_lod_inherits(self):
+        self.assertEquals(list(renderers.RenderLod.get_variation_ids(25, 27)), ['z', 'aa'])
+
+
+class TestRenderVarGetVariationIndex(TestInputRendererBase):
+    def test_single(self):
+        self.assertEquals(renderers.RenderVar.get_variation_index('a'), 0)
+
+    def test_upper(self):
+        self.assertEquals(renderers.RenderVar.get_variation_index('ANG'), 1046)
+
+    def test_round_trip(self):
+        for value in range(0, 20000, 7):
+            self.assertEquals(
+                renderers.RenderVar.get_variation_index(renderers.RenderVar._get_variation_id(value)), value)
+
+    def test_invalid(self):
+        self.assertRaises(exceptions.ValidationError, renderers.RenderVar.get_variation_index, 'a1')
+
+    def test_empty(self):
+        self.assertRaises(exceptions.ValidationError, renderers.RenderVar.get_variation_index, '')
+
 
 class TestInputRendererRenderUniqueTokens(TestInputRendererBase):
     def test_all_replaced(self):
@@ -209,3 +257,252 @@ class TestInputRendererRenderUniqueTokens(TestInputRendererBase):
         test_values_unchanged['la'] = '5'
         self.ir.render_unique_tokens(self.nom, test_values)
         self.assertEquals(test_values, test_values_unchanged)
+
+
+class TestInputRendererRenderPlan(TestInputRendererBase):
+    def test_plan_cached_per_format(self):
+        self.assertIs(self.ir.get_render_plan(self.nom.format), self.ir.get_render_plan(self.nom.format))
+
+    def test_plan_cache_bounded(self):
+        with mock.patch.object(self.ir, 'RENDER_PLAN_CACHE_SIZE', 2):
+            plan = self.ir.get_render_plan('side_name')
+            self.ir.get_render_plan('side_type')
+            self.assertIs(self.ir.get_render_plan('side_name'), plan)
+            self.ir.get_render_plan('name_type')
+            self.assertLessEqual(len(self.ir.RENDER_PLANS), 2)
+            self.assertIn('side_name', self.ir.RENDER_PLANS)
+            self.assertNotIn('side_type', self.ir.RENDER_PLANS)
+
+    def test_plan_token_slots(self):
+        plan = self.ir.get_render_plan('side_location_nameDecoratorVar_childtype_purpose_type')
+        self.assertEquals(plan.get_token_slot('decorator').group('token'), 'Decorator')
+        self.assertIsNone(plan.get_token_slot('not_here'))
+
+    def test_plan_layout(self):
+        plan = self.ir.get_render_plan('side_nameVar_type')
+        self.assertEquals(plan.get_layout(['type', 'side', 'name', 'var']),
+                          (['side', 'name', 'var', 'type'], ['', '_', '', '_', '']))
+
+    def test_plan_render_repeated(self):
+        self.set_values()
+        self.assertEquals(self.nom.get(), 'l_testObjectA_LOC')
+        self.nom.side.set('right')
+        self.assertEquals(self.nom.get(), 'r_testObjectA_LOC')
+
+
+class TestInputRendererResolvedRenderers(TestInputRendererBase):
+    def tearDown(self):
+        super(TestInputRendererResolvedRenderers, self).tearDown()
+        if self.ir.RENDER_FUNCTIONS.pop('resolvetest', None):
+            self.ir.RESOLVED_RENDER_FUNCTIONS.clear()
+
+    def test_numbered_token(self):
+        self.assertIs(self.ir.get_valid_render_function('Var2'), renderers.RenderVar)
+        self.assertIs(self.ir.get_valid_render_function('name'), renderers.RenderBase)
+
+    def test_resolved_mapping(self):
+        resolved = self.ir.get_resolved_render_functions(['version', 'lod1'])
+        self.assertIs(resolved['version'], renderers.RenderVersion)
+        self.assertIs(resolved['lod1'], renderers.RenderLod)
+
+    def test_memoized(self):
+        self.ir.get_valid_render_function('type')
+        with mock.patch.object(self.ir, '_resolve_render_function') as resolve:
+            self.assertIs(self.ir.get_valid_render_function('type'), renderers.RenderType)
+        resolve.assert_not_called()
+
+    def test_invalidated_on_register(self):
+        self.assertIs(self.ir.get_valid_render_function('resolvetest1'), renderers.RenderBase)
+
+        class RenderResolveTest(renderers.RenderBase):
+            token = 'resolvetest'
+
+        self.assertNotIn('resolvetest1', self.ir.get_resolved_render_functions())
+        self.assertIs(self.ir.get_valid_render_function('resolvetest1'), RenderResolveTest)
+
+
+class TestRenderBaseOptionCache(TestInputRendererBase):
+    def setUp(self):
+        super(TestRenderBaseOptionCache, self).setUp()
+        self.nom.CFG.option_cache.clear()
+
+    def test_repeated_render_memoized(self):
+        with mock.patch.object(renderers.RenderBase, 'get_config_match',
+                               wraps=renderers.RenderBase.get_config_match) as get_config_match:
+            first = renderers.RenderBase.render('left', 'side', self.nom)
+            second = renderers.RenderBase.render('left', 'side', self.nom)
+        self.assertEquals(first, second)
+        self.assertEquals(get_config_match.call_count, 1)
+
+    def test_hot_options_kept(self):
+        renderers.RenderBase.render('left', 'side', self.nom)
+        with mock.patch.object(renderers.RenderBase, 'OPTION_CACHE_SIZE', 4), \
+                mock.patch.object(renderers.RenderBase, 'get_config_match',
+                                  wraps=renderers.RenderBase.get_config_match) as get_config_match:
+            for index in range(20):
+                self.assertEquals(renderers.RenderBase.render('left', 'side', self.nom), 'l')
+                renderers.RenderBase.render('name%d' % index, 'name', self.nom)
+            self.assertEquals(len(self.nom.CFG.option_cache), 4)
+        self.assertEquals(get_config_match.call_count, 20)
+
+    def test_settings_part_of_key(self):
+        renderers.RenderBase.render('left', 'side', self.nom)
+        renderers.RenderBase.render('left', 'side', self.nom, side_len=1)
+        self.assertEquals(len(self.nom.CFG.option_cache), 2)
+
+    def test_augmentations_not_memoized(self):
+        self.assertEquals(renderers.RenderBase.render('left', 'side', self.nom), 'l')
+        self.nom.side.case = 'upper'
+        self.assertEquals(renderers.RenderBase.render('left', 'side', self.nom), 'L')
+
+    def test_set_from_dict_invalidates(self):
+        renderers.RenderBase.render('left', 'side', self.nom)
+        config = list(self.nom.CFG.config.items())
+        self.nom.CFG.set_from_dict(config)
+        self.assertEquals(self.nom.CFG.option_cache, {})
+
+    def test_unhashable_settings(self):
+        self.assertEquals(renderers.RenderBase.render('left', 'side', self.nom, side_custom=[]), 'l')
+
+
+class TestRenderTypeSuffixIndex(TestInputRendererBase):
+    def test_exact(self):
+        self.assertEquals(renderers.RenderType.render('joint', 'type', self.nom, type_len=3), 'JNT')
+
+    def test_case_insensitive(self):
+        self.assertEquals(renderers.RenderType.render('JOINT', 'type', self.nom, type_len=3), 'JNT')
+        self.assertEquals(renderers.RenderType.render('plusminusaverage', 'type', self.nom, type_len=3), 'PMA')
+
+    def test_not_found(self):
+        self.assertEquals(renderers.RenderType.render('notAType', 'type', self.nom), 'notAType')
+
+    def test_no_recursive_search(self):
+        self.nom.CFG.option_cache.clear()
+        with mock.patch.object(renderers.RenderType, 'flatten_input') as flatten_input:
+            renderers.RenderType.render('locator', 'type', self.nom)
+        flatten_input.assert_not_called()
+
+
+class TestRender(TestInputRendererBase):
+    def test_render(self):
+        self.set_values()
+        token_values = self.nom.state
+        self.assertEquals(rendering.render(self.nom.format, token_values, self.nom), 'l_testObjectA_LOC')
+        self.assertEquals(token_values, self.nom.state)
+
+    def test_render_settings(self):
+        self.nom.format = 'name_version'
+        self.nom.name = 'test'
+        self.nom.version = 5
+        self.assertEquals(rendering.render(self.nom.format, self.nom.state, self.nom,
+                                           settings={'version_padding': 2}), 'test_05')
+
+
+class TestRenderVersionRange(TestInputRendererBase):
+    def setUp(self):
+        super(TestRenderVersionRange, self).setUp()
+        self.nom.format = 'name_version'
+
+    def test_matches_render(self):
+        self.nom.version.prefix = 'v'
+        self.nom.version.suffix = '%_'
+        self.assertEquals(list(renderers.RenderVersion.render_range(0, 300, 'version', self.nom, padding=3)),
+                          [renderers.RenderVersion.render(i, 'version', self.nom, version_padding=3)
+                           for i in range(300)])
+
+    def test_default_padding(self):
+        self.assertEquals(list(renderers.RenderVersion.render_range(1, 3, 'version', self.nom)), ['0001', '0002'])
+
+    def test_padding_setting(self):
+        self.assertEquals(list(renderers.RenderVersion.render_range(9, 11, 'version', self.nom, version_padding=2)),
+                          ['09', '10'])
+
+    def test_unsafe_case_per_version(self):
+        self.nom.version.case = 'zfill'
+        with mock.patch.object(renderers.RenderVersion, 'process_token_augmentations',
+                               return_value='x') as process_token_augmentations:
+            self.assertEquals(list(renderers.RenderVersion.render_range(0, 2, 'version', self.nom)), ['x', 'x'])
+        self.assertEquals(process_token_augmentations.call_count, 2)
+
+    def test_padding_format_cached(self):
+        self.assertIs(renderers.RenderVersion.get_padding_format(7), renderers.RenderVersion.get_padding_format(7))
+        self.assertEquals(renderers.RenderVersion.get_padding_format(7) % 12, '0000012')
+
+
+class TestRenderDateCache(TestInputRendererBase):
+    def test_iso_skips_dateutil(self):
+        with mock.patch('dateutil.parser.parse') as parse:
+            self.assertEquals(renderers.RenderDate.parse_date('2017-03-16T10:20:30.5'),
+                              datetime.datetime(2017, 3, 16, 10, 20, 30, 500000))
+        parse.assert_not_called()
+
+    def test_invalid_iso_falls_back(self):
+        self.assertRaises(ValueError, renderers.RenderDate.parse_date, '2017-13-45')
+
+    def test_non_iso(self):
+        self.assertEquals(renderers.RenderDate.parse_date('September 21, 2005'), datetime.datetime(2005, 9, 21))
+
+    def test_render_cached(self):
+        renderers.RenderDate._render_specified_date.cache_clear()
+        with mock.patch.object(renderers.RenderDate, 'parse_date',
+                               wraps=renderers.RenderDate.parse_date) as parse_date:
+            for _ in range(3):
+                self.assertEquals(renderers.RenderDate.render('March 16, 2017', 'date', self.nom), '2017-03-16')
+        self.assertEquals(parse_date.call_count, 2)
+
+    def test_partial_not_cached(self):
+        for date in ['March 16', '10:30']:
+            self.assertIsNone(renderers.RenderDate._render_specified_date(date, '%Y-%m-%d'))
+
+    def test_partial_parsed_from_today(self):
+        renderers.RenderDate.render('March 16', 'date', self.nom)
+        with mock.patch('dateutil.parser.parse', return_value=datetime.datetime(1999, 3, 16)) as parse:
+            self.assertEquals(renderers.RenderDate.render('March 16', 'date', self.nom), '1999-03-16')
+        parse.assert_called_once_with('March 16', default=None)
+
+    def test_partial_time(self):
+        self.assertEquals(renderers.RenderDate.render('10:30', 'date', self.nom),
+                          renderers.RenderDate.parse_date('10:30').strftime('%Y-%m-%d'))
+
+    def test_format_part_of_key(self):
+        self.assertEquals(renderers.RenderDate.render('2017-03-16', 'date', self.nom), '2017-03-16')
+        self.nom.date_format = '%d%m%y'
+        self.assertEquals(renderers.RenderDate.render('2017-03-16', 'date', self.nom), '160317')
+
+    def test_frozen_now(self):
+        self.nom.date_now = datetime.datetime(2001, 2, 3)
+        self.assertEquals(renderers.RenderDate.render('now', 'date', self.nom), '2001-02-03')
+        self.assertEquals(renderers.RenderDate.render_column(['now', '2017-03-16'], 'date', self.nom),
+                          ['2001-02-03', '2017-03-16'])
+
+
+class TestRenderColumn(TestBase):
+    def setUp(self):
+        super(TestRenderColumn, self).setUp()
+        self.nom = nom.Nomenclate()
+        self.nom.var.case = 'upper'
+        self.fixtures.append(self.nom)
+
+    def test_base_renders_unique_once(self):
+        with mock.patch.object(renderers.RenderBase, 'render', return_value='x') as render:
+            column = renderers.RenderBase.render_column(['a', 'b', 'a'], 'name', self.nom)
+        self.assertEquals(column, ['x', 'x', 'x'])
+        self.assertEquals(render.call_count, 2)
+
+    def test_var(self):
+        self.assertEquals(renderers.RenderVar.render_column([0, 27, 'b'], 'var', self.nom),
+                          [renderers.RenderVar.render(v, 'var', self.nom) for v in [0, 27, 'b']])
+
+    def test_version(self):
+        version_nom = nom.Nomenclate(format_string='name_version')
+        self.assertEquals(renderers.RenderVersion.render_column([1, 12], 'version', version_nom, version_padding=3),
+                          ['001', '012'])
+
+    def test_type(self):
+        values = ['joint', 'locator', 'not_a_type']
+        self.assertEquals(renderers.RenderType.render_column(values, 'type', self.nom),
+                          [renderers.RenderType.render(v, 'type', self.nom) for v in values])
+
+    def test_date(self):
+        self.assertEquals(renderers.RenderDate.render_column(['2017-03-16', 'bad?'], 'date', self.nom),
+                          ['2017-03-16', ''])
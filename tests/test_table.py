@@ -0,0 +1,61 @@
+import nomenclate as nm
+import nomenclate.core.errors as exceptions
+from nomenclate.core.table import NameTable
+from tests.basetest import TestBase
+
+
+class TestNameTableBase(TestBase):
+    def setUp(self):
+        super(TestNameTableBase, self).setUp()
+        self.nom = nm.Nom({'side': 'left', 'type': 'locator', 'var': 0, 'version': 1},
+                          format_string='side_name_var_type_version')
+        self.nom.var.case = 'upper'
+        self.rows = [{'name': 'obj%d' % (index % 3), 'var': index, 'type': ['joint', 'locator'][index % 2]}
+                     for index in range(20)]
+        self.table = NameTable(self.nom, self.rows)
+        self.fixtures.extend([self.nom, self.rows, self.table])
+
+
+class TestNameTableStorage(TestNameTableBase):
+    def test_columns(self):
+        self.assertEquals(self.table.tokens, ['side', 'name', 'var', 'type', 'version'])
+        self.assertEquals(len(self.table), 20)
+
+    def test_get_column_defaults(self):
+        self.assertEquals(self.table.get_column('side'), ['left'] * 20)
+
+    def test_get_column_converts_labels(self):
+        self.table.append({'version': '3'})
+        self.assertEquals(self.table.get_column('version')[-1], 3)
+
+    def test_get_row(self):
+        self.assertEquals(self.table.get_row(1),
+                          {'side': 'left', 'name': 'obj1', 'var': 1, 'type': 'locator', 'version': 1})
+
+    def test_append_invalid_token(self):
+        self.assertRaises(exceptions.ValidationError, self.table.append, {'bad': 'x'})
+        self.assertEquals(len(self.table), 20)
+
+    def test_append_invalid_label(self):
+        self.assertRaises(exceptions.ValidationError, self.table.append, {'name': ['x']})
+
+    def test_snapshot(self):
+        self.nom.side = 'right'
+        self.assertEquals(self.table.get_column('side')[0], 'left')
+
+
+class TestNameTableRender(TestNameTableBase):
+    def test_render(self):
+        self.assertEquals(self.table.render(), [self.nom.get(**row) for row in self.rows])
+
+    def test_render_settings(self):
+        table = NameTable(self.nom, self.rows, settings={'version_padding': 2})
+        self.assertEquals(table.render()[0], self.nom.get(version_padding=2, **self.rows[0]))
+
+    def test_render_empty(self):
+        self.assertEquals(NameTable(self.nom).render(), [])
+
+    def test_render_static_format(self):
+        nom = nm.Nom(format_string='name_(v)version')
+        self.assertEquals(NameTable(nom, [{'name': 'a'}, {'name': 'b'}]).render(),
+                          [nom.get(name='a'), nom.get(name='b')])
@@ -164,3 +164,45 @@ class TestTokenGt(TestTokenAttrBase):
 
     def test_non_token(self):
         self.assertRaises(AttributeError, tokens.TokenAttr('name', 'Bob').__gt__, '<TokenAttr name(name):\'Bob\'>')
+
+
+class TestTokenSlots(TestTokenAttrBase):
+    def test_state_in_slots(self):
+        self.assertFalse(hasattr(self.token_attr, '__dict__'))
+
+    def test_serialization_round_trip(self):
+        token_attr = tokens.TokenAttr('Name', 'bob', case='upper', prefix='p', suffix='s')
+        self.assertEquals(tokens.TokenAttr.from_json(token_attr.to_json()), token_attr)
+
+    def test_merge_json(self):
+        self.token_attr.merge_json({'label': 'bob', 'case': 'upper'})
+        self.assertEquals((self.token_attr.label, self.token_attr.case), ('bob', 'upper'))
+
+    def test_extra_attribute(self):
+        self.token_attr.padding = 3
+        self.assertEquals(self.token_attr.padding, 3)
+        self.assertRaises(AttributeError, setattr, self.token_attr, 'not_an_attr', 3)
+
+    def test_pickle(self):
+        import pickle
+        self.token_attr.padding = 3
+        token_attr = pickle.loads(pickle.dumps(self.token_attr))
+        self.assertEquals(token_attr, self.token_attr)
+        self.assertEquals(token_attr.padding, 3)
+
+
+class TestTokenAttrCopy(TestTokenAttrBase):
+    def test_equal(self):
+        token_attr = tokens.TokenAttr('Name', 'bob', case='upper', prefix='p', suffix='s')
+        self.assertEquals(token_attr.copy(), token_attr)
+        self.assertEquals(token_attr.copy().raw_token, 'Name')
+
+    def test_independent(self):
+        token_attr = self.token_attr.copy()
+        token_attr.label = 'changed'
+        self.assertNotEqual(self.token_attr.label, 'changed')
+
+    def test_extra_attribute(self):
+        self.token_attr.padding = 3
+        self.assertEquals(self.token_attr.copy().padding, 3)
+        self.assertFalse(hasattr(self.token_attr.copy(), 'length'))
@@ -1,5 +1,6 @@
 import nomenclate as nm
 import nomenclate.core.tokens as tokens
+import nomenclate.core.errors as exceptions
 from tests.basetest import TestBase
 
 
@@ -36,12 +37,12 @@ class TestPurge(TestTokenAttrBase):
     def test_default(self):
         handler = tokens.TokenAttrList(self.nomenclate.state)
         handler.purge_tokens()
-        self.assertEquals(handler.token_attrs, [])
+        self.assertEquals(handler.token_attrs, ())
 
     def test_input(self):
         handler = tokens.TokenAttrList(self.nomenclate.state)
         handler.purge_tokens([token.token for token in handler.token_attrs])
-        self.assertEquals(handler.token_attrs, [])
+        self.assertEquals(handler.token_attrs, ())
 
 
 class TestEq(TestTokenAttrBase):
@@ -62,3 +63,75 @@ class TestStr(TestTokenAttrBase):
         tokens = ['name', 'decorator', 'purpose', 'childtype', 'type', 'location', 'side', 'var']
         for token in tokens:
             self.assertIn(token, str(self.token_attr_dict_handler))
+
+
+class TestTokenAttrListCopy(TestTokenAttrBase):
+    def test_equal(self):
+        self.token_attr_dict_handler.merge_json({'name': 'bob'})
+        copied = self.token_attr_dict_handler.copy()
+        self.assertEquals(copied.to_json(), self.token_attr_dict_handler.to_json())
+        self.assertEquals([t.token for t in copied], [t.token for t in self.token_attr_dict_handler])
+
+    def test_independent(self):
+        copied = self.token_attr_dict_handler.copy()
+        copied.merge_json({'name': 'bob', 'version': 3})
+        self.assertEquals(self.token_attr_dict_handler.name.label, '')
+        self.assertFalse(self.token_attr_dict_handler.has_token_attr('version'))
+
+
+class TestTokenAttrListMergePlainLabels(TestTokenAttrBase):
+    def test_label(self):
+        self.token_attr_dict_handler.merge_json({'Name': '12'})
+        self.assertEquals(self.token_attr_dict_handler.name.label, 12)
+
+    def test_none_keeps_label(self):
+        self.token_attr_dict_handler.merge_json({'name': 'bob'})
+        self.token_attr_dict_handler.merge_json({'name': None})
+        self.assertEquals(self.token_attr_dict_handler.name.label, 'bob')
+
+    def test_invalid_label(self):
+        self.assertRaises(exceptions.ValidationError, self.token_attr_dict_handler.merge_json, {'name': 1.5})
+
+
+class TestTokenIndex(TestTokenAttrBase):
+    def test_merge_json_new_token(self):
+        self.token_attr_dict_handler.merge_json({'Version': 3})
+        self.assertEquals(self.token_attr_dict_handler.version.label, 3)
+        self.assertEquals(self.token_attr_dict_handler.token_attrs[-1].token, 'version')
+
+    def test_merge_json_renamed_token(self):
+        self.token_attr_dict_handler.merge_json({'name': {'token': 'title', 'label': 'bob'}})
+        self.assertRaises(AttributeError, getattr, self.token_attr_dict_handler, 'name')
+        self.assertEquals(self.token_attr_dict_handler.title.label, 'bob')
+
+    def test_merge_token_attr_existing(self):
+        self.token_attr_dict_handler.merge_token_attr(tokens.TokenAttr('name', 'bob'))
+        self.assertEquals(self.token_attr_dict_handler['name'].label, 'bob')
+        self.assertEquals([t.token for t in self.token_attr_dict_handler].count('name'), 1)
+
+    def test_purge_keeps_order(self):
+        remaining = [t.token for t in self.token_attr_dict_handler if t.token not in ['name', 'side']]
+        self.token_attr_dict_handler.purge_tokens(['name', 'side'])
+        self.assertFalse(self.token_attr_dict_handler.has_token_attr('name'))
+        self.assertRaises(IndexError, self.token_attr_dict_handler.__getitem__, 'side')
+        self.assertEquals([t.token for t in self.token_attr_dict_handler], remaining)
+
+    def test_reset(self):
+        self.token_attr_dict_handler.merge_json({'name': 'bob', 'side': 'left'})
+        self.token_attr_dict_handler.reset()
+        self.assertEquals(len(self.token_attr_dict_handler.unset_token_attrs),
+                          len(self.token_attr_dict_handler.token_attrs))
+
+    def test_token_attrs_read_only(self):
+        self.assertIsInstance(self.token_attr_dict_handler.token_attrs, tuple)
+        self.assertEquals(list(self.token_attr_dict_handler.token_attrs), list(self.token_attr_dict_handler))
+
+    def test_set_token_attrs(self):
+        self.token_attr_dict_handler.token_attrs = [tokens.TokenAttr('name', 'bob')]
+        self.assertEquals(self.token_attr_dict_handler.to_json(),
+                          {'name': tokens.TokenAttr('name', 'bob').to_json()})
+
+    def test_deepcopy(self):
+        import copy
+        self.token_attr_dict_handler.merge_json({'name': 'bob'})
+        self.assertEquals(copy.deepcopy(self.token_attr_dict_handler), self.token_attr_dict_handler)